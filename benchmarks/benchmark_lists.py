@@ -0,0 +1,91 @@
+"""Benchmark list parsing hot paths.
+
+List-heavy documents exercise marker classification, the list item loop,
+and the container stack. The marker group times the helpers in
+``patitas.parsing.blocks.list.marker`` with their caches bypassed, so the
+pure-Python scanning cost is visible on its own.
+
+Run with:
+    pytest benchmarks/benchmark_lists.py -v --benchmark-only
+"""
+
+try:
+    import pytest
+
+    from patitas import Markdown
+    from patitas.parsing.blocks.list.marker import (
+        extract_marker_info,
+        get_marker_indent,
+        is_list_marker,
+    )
+
+    MARKERS = ["- ", "  * ", "    + ", "1. ", "  10) ", "      123. ", "-", "9."]
+
+    def _list_heavy_doc(sections: int = 200) -> str:
+        return "\n".join(
+            f"""- item {i}
+  - nested {i}
+    1. deep {i}
+    2. deep {i}
+- [ ] task {i}
+- [x] done {i}
+
+1. loose {i}
+
+2. loose {i}
+   continued paragraph
+
+   > quoted {i}
+"""
+            for i in range(sections)
+        )
+
+    @pytest.fixture
+    def list_doc() -> str:
+        return _list_heavy_doc()
+
+    @pytest.mark.benchmark(group="parse-lists")
+    def test_benchmark_parse_list_heavy(benchmark, list_doc):
+        """Parse-only for a nested/ordered/task/loose list document."""
+        md = Markdown(plugins=["task_lists"])
+
+        def do_parse():
+            md.parse(list_doc)
+
+        benchmark(do_parse)
+
+    @pytest.mark.benchmark(group="list-markers")
+    def test_benchmark_extract_marker_info_uncached(benchmark):
+        """extract_marker_info scanning cost without the lru_cache."""
+        extract = extract_marker_info.__wrapped__
+
+        def do_extract():
+            for marker in MARKERS:
+                extract(marker)
+
+        benchmark(do_extract)
+
+    @pytest.mark.benchmark(group="list-markers")
+    def test_benchmark_get_marker_indent_uncached(benchmark):
+        """get_marker_indent scanning cost without the lru_cache."""
+        indent = get_marker_indent.__wrapped__
+
+        def do_indent():
+            for marker in MARKERS:
+                indent(marker)
+
+        benchmark(do_indent)
+
+    @pytest.mark.benchmark(group="list-markers")
+    def test_benchmark_is_list_marker(benchmark):
+        """is_list_marker on marker and non-marker content lines."""
+        lines = [m.lstrip() + "text" for m in MARKERS] + ["plain text", "> quote", "#"]
+
+        def do_check():
+            for line in lines:
+                is_list_marker(line)
+
+        benchmark(do_check)
+
+except ImportError:
+    pass  # pytest not available
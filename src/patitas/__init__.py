@@ -142,8 +142,6 @@ def parse(
         >>> cache = DictParseCache()
         >>> doc = parse("# Hello", cache=cache)
     """
-    from patitas.profiling import get_parse_accumulator
-
     registry = directive_registry or create_default_registry()
 
     # Build config and set via ContextVar for thread-safety
@@ -81,6 +81,12 @@ def _inline_text_html(node: Inline) -> str:
     return ""
 
 
+def _first_line(text: str) -> str:
+    """Return text up to its first newline without copying the rest."""
+    end = text.find("\n")
+    return text if end == -1 else text[:end]
+
+
 def _block_text(node: Block, source: str) -> str:
     """Extract plain text from a block node."""
     if isinstance(node, Paragraph):
@@ -102,12 +108,12 @@ def _block_text(node: Block, source: str) -> str:
     if isinstance(node, FencedCode):
         try:
             code = node.get_code(source)
-            first_line = (code or "").split("\n", 1)[0]
+            first_line = _first_line(code or "")
             return f" {first_line}" if first_line else ""
         except IndexError, TypeError:
             return ""
     if isinstance(node, IndentedCode):
-        first_line = (node.code or "").split("\n", 1)[0]
+        first_line = _first_line(node.code or "")
         return f" {first_line}" if first_line else ""
     return ""
 
@@ -139,12 +145,12 @@ def _block_text_html(node: Block, source: str) -> str:
     if isinstance(node, FencedCode):
         try:
             code = node.get_code(source)
-            first_line = (code or "").split("\n", 1)[0]
+            first_line = _first_line(code or "")
             return f"<p><code>{first_line}</code></p>" if first_line else ""
         except IndexError, TypeError:
             return ""
     if isinstance(node, IndentedCode):
-        first_line = (node.code or "").split("\n", 1)[0]
+        first_line = _first_line(node.code or "")
         return f"<p><code>{first_line}</code></p>" if first_line else ""
     return ""
 
@@ -55,11 +55,11 @@ class ListClassifierMixin:
                 )
             return None
 
-        # Ordered: 1. or 1)
-        if content[0].isdigit():
+        # Ordered: 1. or 1) -- CommonMark digits are ASCII 0-9 only
+        if "0" <= content[0] <= "9":
             content_len = len(content)  # Cache length
             pos = 0
-            while pos < content_len and content[pos].isdigit():
+            while pos < content_len and "0" <= content[pos] <= "9":
                 pos += 1
             if pos > 9:
                 return None
@@ -171,7 +171,7 @@ class Parser(
         self._current = None
         self._link_refs = {}
         self._directive_stack = []
-        self._containers = ContainerStack()
+        self._containers.reset()
         self._allow_setext_headings = True
         self._config_cache = None
         self._line_starts = None
@@ -263,15 +263,13 @@ class Parser(
 
         # COMPILED DISPATCH: Pattern-specific parsers for common patterns
         # Covers ~58% of CommonMark spec with 16.5x average speedup
-        # Only used for patterns that don't need link reference collection
+        # Registered patterns never contain LINK_REFERENCE_DEF, so a hit needs
+        # no link reference collection and no further scan of the tokens
         dispatcher = get_dispatcher()
         pattern_parser = dispatcher.get_parser(self._tokens)
         if pattern_parser is not None:
-            # Check if pattern needs link refs (has LINK_REFERENCE_DEF tokens)
-            has_link_refs = any(tok.type == TokenType.LINK_REFERENCE_DEF for tok in self._tokens)
-            if not has_link_refs:
-                # Fast path: use pattern-specific parser
-                return pattern_parser(self._tokens, self._parse_inline)
+            # Fast path: use pattern-specific parser
+            return pattern_parser(self._tokens, self._parse_inline)
 
         # First pass: collect link reference definitions
         # These are needed before inline parsing to resolve [text][ref] patterns
@@ -17,10 +17,7 @@ from patitas.nodes import (
     Table,
     ThematicBreak,
 )
-from patitas.parsing.blocks.quote_fast_path import (
-    is_simple_block_quote,
-    parse_simple_block_quote,
-)
+from patitas.parsing.blocks.quote_fast_path import try_parse_simple_block_quote
 from patitas.parsing.protocols import BlockParsingHost, ParserHost, TokenNavHost
 from patitas.tokens import TokenType
 
@@ -31,6 +28,16 @@ if TYPE_CHECKING:
 # Pattern to find backslash escapes (CommonMark ASCII punctuation)
 _ESCAPE_PATTERN = re.compile(r"\\([!\"#$%&'()*+,\-./:;<=>?@\[\\\]^_`{|}~])")
 
+# Block-level tokens whose value is copied verbatim into quoted content
+_QUOTED_LINE_TYPES = frozenset(
+    {
+        TokenType.ATX_HEADING,
+        TokenType.PARAGRAPH_LINE,
+        TokenType.THEMATIC_BREAK,
+        TokenType.LIST_ITEM_MARKER,
+    }
+)
+
 
 def _process_escapes(text: str) -> str:
     """Process backslash escapes in info strings.
@@ -407,7 +414,7 @@ class BlockParsingCoreMixin:
             i = self._pos
             while i < n_tokens:
                 tok = tokens[i]
-                if tok.type != TokenType.BLOCK_QUOTE_MARKER or tok.location.lineno != line:
+                if tok.type is not TokenType.BLOCK_QUOTE_MARKER or tok.location.lineno != line:
                     break
                 same_line_markers += 1
                 if same_line_markers > budget:
@@ -423,12 +430,9 @@ class BlockParsingCoreMixin:
 
         # Fast path: simple block quotes with single paragraph
         # Bypasses recursive sub-parser for ~3-5% performance gain
-        if is_simple_block_quote(self._tokens, self._pos):
-            quote_node, new_pos = parse_simple_block_quote(
-                self._tokens,
-                self._pos,
-                self._parse_inline,
-            )
+        simple = try_parse_simple_block_quote(self._tokens, self._pos, self._parse_inline)
+        if simple is not None:
+            quote_node, new_pos = simple
             # Update parser position
             self._pos = new_pos
             self._current = self._tokens[new_pos] if new_pos < len(self._tokens) else None
@@ -463,9 +467,11 @@ class BlockParsingCoreMixin:
         while not self._at_end():
             token = self._current
             assert token is not None
+            token_type = token.type
+            token_lineno = token.location.lineno
 
             # If line changes, handle line transition
-            if last_marker_line is not None and token.location.lineno != last_marker_line:
+            if last_marker_line is not None and token_lineno != last_marker_line:
                 # Check if the previous line was empty (just > with no content)
                 if not current_line_has_content and not current_line_parts:
                     # Empty > line - add blank line and reset paragraph content flag
@@ -475,7 +481,7 @@ class BlockParsingCoreMixin:
 
                 # Check for lazy continuation or end of block quote
                 # CommonMark: Lazy continuation ONLY applies to paragraphs
-                if token.type == TokenType.PARAGRAPH_LINE:
+                if token_type is TokenType.PARAGRAPH_LINE:
                     # Lazy continuation requires open paragraph, NOT code block
                     if not has_paragraph_content or in_fenced_code:
                         break
@@ -483,10 +489,10 @@ class BlockParsingCoreMixin:
                     has_lazy_continuation = True
                     content_lines.append(token.value.lstrip())
                     current_line_has_content = True  # Mark that we added content
-                    last_marker_line = token.location.lineno
+                    last_marker_line = token_lineno
                     self._advance()
                     continue
-                elif token.type == TokenType.INDENTED_CODE:
+                elif token_type is TokenType.INDENTED_CODE:
                     # Lazy continuation requires open paragraph, NOT code block
                     if not has_paragraph_content or in_fenced_code:
                         break
@@ -495,16 +501,16 @@ class BlockParsingCoreMixin:
                     has_lazy_continuation = True
                     content_lines.append("    " + token.value.rstrip("\n"))
                     current_line_has_content = True  # Mark that we added content
-                    last_marker_line = token.location.lineno
+                    last_marker_line = token_lineno
                     self._advance()
                     continue
-                elif token.type == TokenType.BLOCK_QUOTE_MARKER:
+                elif token_type is TokenType.BLOCK_QUOTE_MARKER:
                     # New line with > marker - continue the block quote
-                    last_marker_line = token.location.lineno
+                    last_marker_line = token_lineno
                     current_line_has_content = False  # Reset for new line
                     self._advance()
                     continue
-                elif token.type == TokenType.BLANK_LINE:
+                elif token_type is TokenType.BLANK_LINE:
                     # CommonMark: A blank line without > marker ends the blockquote.
                     break
                 else:
@@ -512,13 +518,13 @@ class BlockParsingCoreMixin:
                     break
 
             # Handle tokens on the current line (same line as last marker)
-            if token.type == TokenType.BLOCK_QUOTE_MARKER:
+            if token_type is TokenType.BLOCK_QUOTE_MARKER:
                 # Nested > marker - include it in content for sub-parsing
                 current_line_parts.append("> ")
                 current_line_has_content = True
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
-            elif token.type == TokenType.FENCED_CODE_START:
+            elif token_type is TokenType.FENCED_CODE_START:
                 # Fenced code in block quote
                 value = token.value
                 if value.startswith("I") and ":" in value:
@@ -529,44 +535,39 @@ class BlockParsingCoreMixin:
                 in_fenced_code = True
                 has_paragraph_content = False
                 current_line_has_content = True
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
-            elif token.type == TokenType.FENCED_CODE_END:
+            elif token_type is TokenType.FENCED_CODE_END:
                 # Closing fence
                 current_line_parts.append(token.value.rstrip("\n"))
                 in_fenced_code = False
                 current_line_has_content = True
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
-            elif token.type == TokenType.FENCED_CODE_CONTENT:
+            elif token_type is TokenType.FENCED_CODE_CONTENT:
                 # Fenced code content
                 current_line_parts.append(token.value.rstrip("\n"))
                 current_line_has_content = True
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
-            elif token.type == TokenType.LINK_REFERENCE_DEF:
+            elif token_type is TokenType.LINK_REFERENCE_DEF:
                 # Link reference definitions inside block quotes are document-level metadata.
                 # Do not include them in the rendered blockquote content to avoid recursive
                 # block quote re-parsing (example 218).
                 current_line_parts.clear()
                 has_paragraph_content = False
                 current_line_has_content = False
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
-            elif token.type in (
-                TokenType.ATX_HEADING,
-                TokenType.PARAGRAPH_LINE,
-                TokenType.THEMATIC_BREAK,
-                TokenType.LIST_ITEM_MARKER,
-            ):
+            elif token_type in _QUOTED_LINE_TYPES:
                 # Block content - use token.value
                 line_value = token.value.rstrip("\n")
-                if token.type == TokenType.LIST_ITEM_MARKER:
+                if token_type is TokenType.LIST_ITEM_MARKER:
                     # Normalize leading spaces so nested lists inside block quotes
                     # aren't treated as indented code (CommonMark 259/260).
                     line_value = line_value.lstrip()
                     last_was_list_marker = True
-                elif token.type == TokenType.PARAGRAPH_LINE and last_was_list_marker:
+                elif token_type is TokenType.PARAGRAPH_LINE and last_was_list_marker:
                     # Strip indentation immediately following a list marker on the same line
                     line_value = line_value.lstrip()
                 current_line_parts.append(line_value)
@@ -575,7 +576,10 @@ class BlockParsingCoreMixin:
                 # Update has_paragraph_content
                 # Note: PARAGRAPH_LINE with 4+ leading spaces will become indented code
                 # in sub-parser, so it's NOT paragraph content for lazy continuation
-                if token.type in (TokenType.PARAGRAPH_LINE, TokenType.LIST_ITEM_MARKER):
+                if (
+                    token_type is TokenType.PARAGRAPH_LINE
+                    or token_type is TokenType.LIST_ITEM_MARKER
+                ):
                     content = token.value.rstrip("\n")
                     leading_spaces = len(content) - len(content.lstrip())
                     # 4+ leading spaces = indented code (not paragraph content)
@@ -583,22 +587,22 @@ class BlockParsingCoreMixin:
                 else:
                     has_paragraph_content = False
 
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
-            elif token.type == TokenType.BLANK_LINE:
+            elif token_type is TokenType.BLANK_LINE:
                 # Blank line within blockquote (after > on same line - shouldn't happen)
                 flush_current_line()
                 content_lines.append("")
                 has_paragraph_content = False
                 current_line_has_content = False
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
             else:
                 # Other token types - just add as content
                 current_line_parts.append(token.value.rstrip("\n"))
                 has_paragraph_content = False
                 current_line_has_content = True
-                last_marker_line = token.location.lineno
+                last_marker_line = token_lineno
                 self._advance()
 
         flush_current_line()
@@ -645,7 +649,6 @@ class BlockParsingCoreMixin:
                 tokens = self._tokens
                 tokens_len = len(tokens)
                 source = self._source
-                source_len = len(source)
 
                 while next_pos < tokens_len:
                     next_token = tokens[next_pos]
@@ -653,10 +656,7 @@ class BlockParsingCoreMixin:
                         # Get original line content to preserve whitespace
                         # (blank lines with 4+ spaces should keep excess spaces)
                         offset = next_token.location.offset
-                        line_start = self._line_start_for_offset(offset)
-                        line_end = source.find("\n", offset)
-                        if line_end == -1:
-                            line_end = source_len
+                        line_start, line_end = self._line_bounds(offset)
                         original_line = source[line_start:line_end]
                         # If line has 4+ spaces, preserve the excess
                         orig_len = len(original_line)
@@ -8,8 +8,11 @@ Phase 4: Uses ContainerStack for indent queries (stack is source of truth).
 from typing import TYPE_CHECKING
 
 from patitas.parsing.blocks.list.marker import (
+    CONTENT_BLOCK_QUOTE,
+    CONTENT_FENCE,
+    CONTENT_LIST_MARKER,
+    classify_indented_content,
     get_marker_indent,
-    is_list_marker,
 )
 from patitas.tokens import TokenType
 
@@ -21,10 +24,14 @@ if TYPE_CHECKING:
 class BlankLineResult:
     """Base class for blank line handling results."""
 
+    __slots__ = ()
+
 
 class ContinueList(BlankLineResult):
     """Continue parsing the current list (may mark as loose)."""
 
+    __slots__ = ("is_loose", "save_paragraph")
+
     def __init__(self, is_loose: bool = False, save_paragraph: bool = False):
         self.is_loose = is_loose
         self.save_paragraph = save_paragraph
@@ -33,6 +40,8 @@ class ContinueList(BlankLineResult):
 class EndItem(BlankLineResult):
     """End the current list item but continue the list."""
 
+    __slots__ = ("is_loose",)
+
     def __init__(self, is_loose: bool = True):
         self.is_loose = is_loose
 
@@ -40,22 +49,46 @@ class EndItem(BlankLineResult):
 class EndList(BlankLineResult):
     """End the entire list."""
 
+    __slots__ = ()
+
 
 class ParseBlock(BlankLineResult):
-    """Parse the next token as a block element within the list item."""
+    """Parse the next token as a block element within the list item.
 
-    def __init__(self, is_loose: bool = True):
+    content_kind carries classify_indented_content() flags when the next
+    token is INDENTED_CODE, so the caller need not classify it again.
+    """
+
+    __slots__ = ("content_kind", "is_loose")
+
+    def __init__(self, is_loose: bool = True, content_kind: int = 0):
         self.is_loose = is_loose
+        self.content_kind = content_kind
 
 
 class ParseContinuation(BlankLineResult):
     """Parse the next token as continuation content."""
 
+    __slots__ = ("is_loose", "save_paragraph")
+
     def __init__(self, is_loose: bool = True, save_paragraph: bool = True):
         self.is_loose = is_loose
         self.save_paragraph = save_paragraph
 
 
+# Every outcome handle_blank_line can produce is fixed, so each is built once
+# and shared; the list item loop only reads them
+_END_LIST = EndList()
+_END_ITEM = EndItem(is_loose=True)
+_CONTINUE_LIST = ContinueList(is_loose=True)
+_PARSE_BLOCK = ParseBlock(is_loose=True)
+_PARSE_CONTINUATION = ParseContinuation(is_loose=True, save_paragraph=True)
+_PARSE_BLOCK_BY_KIND = {
+    kind: ParseBlock(is_loose=True, content_kind=kind)
+    for kind in (CONTENT_LIST_MARKER, CONTENT_BLOCK_QUOTE, CONTENT_FENCE)
+}
+
+
 def handle_blank_line(
     next_token: Token | None,
     containers: ContainerStack,
@@ -75,7 +108,7 @@ def handle_blank_line(
 
     """
     if next_token is None:
-        return EndList()
+        return _END_LIST
 
     current = containers.current()
     start_indent = current.start_indent
@@ -84,27 +117,27 @@ def handle_blank_line(
     match next_token.type:
         case TokenType.LINK_REFERENCE_DEF:
             # CommonMark: Link reference definitions don't interrupt lists
-            return ContinueList(is_loose=True)
+            return _CONTINUE_LIST
 
         case TokenType.LIST_ITEM_MARKER:
             next_indent = get_marker_indent(next_token.value)
             if next_indent < start_indent:
                 # Less than start_indent - belongs to outer list (ends this list)
-                return EndList()
+                return _END_LIST
             if next_indent < check_indent:
                 # Less than content_indent but >= start_indent - sibling item
-                return EndItem(is_loose=True)
+                return _END_ITEM
             # At or beyond content_indent - could be nested list
-            return ContinueList(is_loose=True)
+            return _CONTINUE_LIST
 
         case TokenType.PARAGRAPH_LINE:
             # Use pre-computed line_indent from lexer
             para_indent = next_token.line_indent
             if para_indent < check_indent:
                 # Not indented enough - terminates the list
-                return EndList()
+                return _END_LIST
             # Indented enough - continuation paragraph (loose list)
-            return ParseContinuation(is_loose=True, save_paragraph=True)
+            return _PARSE_CONTINUATION
 
         case (
             TokenType.FENCED_CODE_START
@@ -117,8 +150,8 @@ def handle_blank_line(
             # the list and is parsed at the parent level (CommonMark 5.3/5.4).
             block_indent = next_token.line_indent if next_token.line_indent >= 0 else 0
             if block_indent < check_indent:
-                return EndList()
-            return ParseBlock(is_loose=True)
+                return _END_LIST
+            return _PARSE_BLOCK
 
         case TokenType.INDENTED_CODE:
             return _handle_blank_then_indented_code(
@@ -127,7 +160,7 @@ def handle_blank_line(
             )
 
         case _:
-            return EndList()
+            return _END_LIST
 
 
 def _handle_blank_then_indented_code(
@@ -156,39 +189,28 @@ def _handle_blank_then_indented_code(
 
     # Use pre-computed line_indent from lexer
     original_indent = token.line_indent
-    code_content = token.value.lstrip().rstrip()
+    kind = classify_indented_content(token.value.strip())
 
     # Check if this is a list marker at the original list level
-    if original_indent == start_indent and is_list_marker(code_content):
+    if original_indent == start_indent and kind & CONTENT_LIST_MARKER:
         # This is a sibling list item
-        return EndItem(is_loose=True)
-
-    # Check indent relative to content
-    indent_beyond_content = original_indent - check_indent
+        return _END_ITEM
 
     # After a blank line, content can only continue if at or beyond content indent
     # Content BELOW content indent terminates the item (falls through to EndList)
 
     # Check for special block elements at content level
     if original_indent >= check_indent:
-        # Block quote
-        if code_content.startswith(">"):
-            return ParseBlock(is_loose=True)
-
-        # Fenced code
-        if code_content.startswith(("```", "~~~")):
-            return ParseBlock(is_loose=True)
-
-        # Nested list marker
-        if is_list_marker(code_content):
-            return ParseBlock(is_loose=True)
+        # Block quote, fenced code or nested list marker
+        if kind:
+            return _PARSE_BLOCK_BY_KIND[kind]
 
         # Indented code (4+ beyond content)
-        if indent_beyond_content >= 4:
-            return ParseBlock(is_loose=True)
+        if original_indent - check_indent >= 4:
+            return _PARSE_BLOCK
 
         # Default: paragraph continuation
-        return ParseContinuation(is_loose=True, save_paragraph=True)
+        return _PARSE_CONTINUATION
 
     # Not indented enough - terminates list
-    return EndList()
+    return _END_LIST
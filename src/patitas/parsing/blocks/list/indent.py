@@ -3,7 +3,7 @@
 Provides functions for calculating and managing indentation levels.
 """
 
-from patitas.parsing.blocks.list.marker import get_marker_indent
+from patitas.parsing.blocks.list.marker import get_marker_indent, get_marker_width
 
 
 def calculate_content_indent(
@@ -35,8 +35,7 @@ def calculate_content_indent(
     end = source.find("\n", line_start_pos)
     original_line = source[line_start_pos:end] if end != -1 else source[line_start_pos:]
 
-    parts = marker_stripped.split()
-    marker_part = parts[0] if parts else marker_stripped
+    marker_part = marker_stripped[: get_marker_width(marker_stripped)]
     marker_pos_in_line = original_line.find(marker_part)
     if marker_pos_in_line == -1:
         # Fallback: use marker_indent + marker_length + 1
@@ -58,6 +57,37 @@ def calculate_content_indent(
     return marker_end_col + spaces_after
 
 
+def count_whitespace_columns(text: str, col: int = 0) -> int:
+    """Count the columns spanned by the leading spaces/tabs of text.
+
+    Tabs expand to the next multiple-of-4 tab stop, measured from ``col``
+    (the column at which ``text`` starts). Runs of plain spaces are counted
+    with ``str.lstrip`` so only lines with tabs pay for the loop.
+
+    Args:
+        text: The text whose leading whitespace is measured
+        col: The column at which text starts (0-indexed)
+
+    Returns:
+        Number of columns before the first non-whitespace character
+
+    """
+    n = len(text) - len(text.lstrip(" "))
+    if n == len(text) or text[n] != "\t":
+        return n
+    start = col
+    col += n
+    for i in range(n, len(text)):
+        ch = text[i]
+        if ch == " ":
+            col += 1
+        elif ch == "\t":
+            col += 4 - (col % 4)
+        else:
+            break
+    return col - start
+
+
 def is_continuation_indent(
     line_indent: int,
     content_indent: int,
@@ -16,6 +16,8 @@ from patitas.nodes import (
 from patitas.tokens import TokenType
 
 if TYPE_CHECKING:
+    from typing import Literal
+
     from patitas.nodes import Block
     from patitas.parsing.protocols import ParserHost as ParserProtocol
     from patitas.tokens import Token
@@ -99,7 +101,7 @@ def parse_block_quote_from_indented_code(
 
     """
     bq_lines: list[str] = []
-    code_content = start_token.value.lstrip().rstrip()
+    code_content = start_token.value.strip()
 
     # Extract initial content
     if code_content.startswith("> "):
@@ -114,9 +116,9 @@ def parse_block_quote_from_indented_code(
         if bq_tok is None:
             break
 
-        if bq_tok.type == TokenType.INDENTED_CODE:
+        if bq_tok.type is TokenType.INDENTED_CODE:
             bq_original_indent = bq_tok.line_indent
-            bq_content = bq_tok.value.lstrip().rstrip()
+            bq_content = bq_tok.value.strip()
             if bq_original_indent >= check_indent and bq_content.startswith(">"):
                 if bq_content.startswith("> "):
                     bq_lines.append(bq_content[2:])
@@ -125,7 +127,7 @@ def parse_block_quote_from_indented_code(
                 parser._advance()
             else:
                 break
-        elif bq_tok.type == TokenType.BLANK_LINE:
+        elif bq_tok.type is TokenType.BLANK_LINE:
             parser._advance()
             break
         else:
@@ -155,11 +157,10 @@ def parse_fenced_code_from_indented_code(
         A FencedCode node
 
     """
-    from typing import Literal
-
-    code_content = start_token.value.lstrip().rstrip()
+    code_content = start_token.value.strip()
     fence_char = code_content[0]
     fence_count = len(code_content) - len(code_content.lstrip(fence_char))
+    fence = code_content[:fence_count]
     info_string = code_content[fence_count:].strip() or None
 
     parser._advance()
@@ -172,18 +173,21 @@ def parse_fenced_code_from_indented_code(
         if fc_tok is None:
             break
 
-        if fc_tok.type == TokenType.INDENTED_CODE:
-            fc_content = fc_tok.value.lstrip().rstrip()
-            # Check for closing fence
-            if fc_content.startswith(fence_char * fence_count) and not fc_content.strip(fence_char):
-                parser._advance()
-                break
+        if fc_tok.type is TokenType.INDENTED_CODE:
+            fc_value = fc_tok.value
+            # Check for closing fence; only a line containing the fence run can
+            # close it, so ordinary code lines skip the strip
+            if fence in fc_value:
+                fc_content = fc_value.strip()
+                if fc_content.startswith(fence) and not fc_content.strip(fence_char):
+                    parser._advance()
+                    break
             # Accumulate content
             if source_start is None:
                 source_start = fc_tok.location.offset
             source_end = fc_tok.location.end_offset
             parser._advance()
-        elif fc_tok.type == TokenType.BLANK_LINE:
+        elif fc_tok.type is TokenType.BLANK_LINE:
             parser._advance()
         else:
             break
@@ -225,19 +229,19 @@ def parse_indented_code_in_list(
         if tok is None:
             break
 
-        if tok.type == TokenType.INDENTED_CODE:
+        if tok.type is TokenType.INDENTED_CODE:
             tok_indent = tok.line_indent
             if tok_indent >= check_indent + 4:
                 code_lines.append(tok.value)
                 parser._advance()
             else:
                 break
-        elif tok.type == TokenType.BLANK_LINE:
+        elif tok.type is TokenType.BLANK_LINE:
             # CommonMark: blank lines within indented code are preserved.
             # Consume all consecutive blank lines and check if more code follows.
             blank_count = 0
             while not parser._at_end() and parser._current is not None:
-                if parser._current.type == TokenType.BLANK_LINE:
+                if parser._current.type is TokenType.BLANK_LINE:
                     blank_count += 1
                     parser._advance()
                 else:
@@ -246,7 +250,7 @@ def parse_indented_code_in_list(
             # Check if next token is more indented code
             if not parser._at_end() and parser._current is not None:
                 next_tok = parser._current
-                if next_tok.type == TokenType.INDENTED_CODE:
+                if next_tok.type is TokenType.INDENTED_CODE:
                     tok_indent = next_tok.line_indent
                     if tok_indent >= check_indent + 4:
                         # Include blank lines and continue
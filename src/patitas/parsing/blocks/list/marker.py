@@ -3,12 +3,32 @@
 Provides functions for detecting and classifying list markers.
 """
 
+import re
+from collections.abc import Callable
 from functools import lru_cache
 
 from patitas.parsing.blocks.list.types import ListMarkerInfo
 
+# Ordered marker: ASCII digit run plus the character that follows it (if any)
+_ORDERED_MARKER_RE = re.compile(r"([0-9]+)(.?)")
 
-@lru_cache(maxsize=128)
+# List marker at the start of stripped text: bullet or ASCII digits plus . or ),
+# then space/tab or end of text (\Z, so a trailing newline does not count)
+_LIST_MARKER_RE = re.compile(r"(?:[-*+]|[0-9]+[.)])(?:[ \t]|\Z)")
+
+# Bullet-plus-space heads mapped to their bullet character
+_UNORDERED_FAST: dict[str, str] = {"- ": "-", "* ": "*", "+ ": "+"}
+
+# Task list prefixes mapped to their checked state
+_TASK_PREFIXES: dict[str, bool] = {"[ ] ": False, "[x] ": True, "[X] ": True}
+
+# Bit flags returned by classify_indented_content()
+CONTENT_LIST_MARKER = 1
+CONTENT_BLOCK_QUOTE = 2
+CONTENT_FENCE = 4
+
+
+@lru_cache(maxsize=256)
 def get_marker_indent(marker_value: str) -> int:
     """Extract indent level from list marker value.
 
@@ -24,6 +44,9 @@ def get_marker_indent(marker_value: str) -> int:
         The column position where the marker starts
 
     """
+    if "\t" not in marker_value:
+        # Common case: space-only prefix, counted in C without a Python loop
+        return len(marker_value) - len(marker_value.lstrip(" "))
     indent = 0
     for char in marker_value:
         if char == " ":
@@ -35,7 +58,30 @@ def get_marker_indent(marker_value: str) -> int:
     return indent
 
 
-@lru_cache(maxsize=256)
+def _scan_prefix(marker_value: str) -> tuple[int, int]:
+    """Return ``(indent, offset)`` for the leading space/tab run in one pass.
+
+    Fuses ``get_marker_indent`` with locating the marker so the whitespace
+    prefix is walked once: ``indent`` is the tab-expanded column and
+    ``offset`` the index of the first marker character.
+    """
+    if "\t" not in marker_value:
+        offset = len(marker_value) - len(marker_value.lstrip(" "))
+        return offset, offset
+    indent = 0
+    offset = 0
+    for char in marker_value:
+        if char == " ":
+            indent += 1
+        elif char == "\t":
+            indent += 4 - (indent % 4)
+        else:
+            break
+        offset += 1
+    return indent, offset
+
+
+@lru_cache(maxsize=512)
 def extract_marker_info(marker_value: str, start_indent: int | None = None) -> ListMarkerInfo:
     """Extract complete marker information from a marker token value.
 
@@ -47,40 +93,44 @@ def extract_marker_info(marker_value: str, start_indent: int | None = None) -> L
         ListMarkerInfo with all extracted information
 
     """
-    indent = start_indent if start_indent is not None else get_marker_indent(marker_value)
-    marker_stripped = marker_value.lstrip()
-    ordered = marker_stripped[0].isdigit() if marker_stripped else False
+    indent, offset = _scan_prefix(marker_value)
+    if start_indent is not None:
+        indent = start_indent
+    length = len(marker_value)
+
+    # Fast path: "- ", "* ", "+ " is the shape nearly every bullet item has
+    fast_bullet = _UNORDERED_FAST.get(marker_value[offset : offset + 2])
+    if fast_bullet is not None:
+        end = offset + 2
+        while end < length and marker_value[end] == " ":
+            end += 1
+        return ListMarkerInfo(False, fast_bullet, "", 1, indent, end - offset)
+
+    if offset == length:
+        # Whitespace-only value: treat as a bare "-" bullet
+        return ListMarkerInfo(False, "-", "", 1, indent, 1)
+
+    ordered = "0" <= marker_value[offset] <= "9"
 
     bullet_char = ""
     ordered_marker_char = ""
     start = 1
 
     if ordered:
-        # Extract starting number and marker style from ordered list
-        num_str = ""
-        for c in marker_stripped:
-            if c.isdigit():
-                num_str += c
-            else:
-                ordered_marker_char = c
-                break
-        if num_str:
-            start = int(num_str)
-        marker_length = len(num_str) + 1  # digits + marker char
+        # One anchored match splits the digit run from the marker character
+        match = _ORDERED_MARKER_RE.match(marker_value, offset)
+        assert match is not None  # first char is a digit
+        digits, ordered_marker_char = match.groups()
+        start = int(digits)
+        end = offset + len(digits) + 1  # digits + marker char
     else:
-        bullet_char = marker_stripped[0] if marker_stripped else "-"
-        marker_length = 1
+        bullet_char = marker_value[offset]
+        end = offset + 1
 
     # Calculate actual marker length including trailing space
-    if marker_stripped:
-        marker_char_end = marker_length
-        spaces_after_marker = 0
-        for i in range(marker_char_end, len(marker_stripped)):
-            if marker_stripped[i] == " ":
-                spaces_after_marker += 1
-            else:
-                break
-        marker_length = marker_char_end + spaces_after_marker
+    while end < length and marker_value[end] == " ":
+        end += 1
+    marker_length = end - offset
 
     return ListMarkerInfo(
         ordered=ordered,
@@ -92,6 +142,26 @@ def extract_marker_info(marker_value: str, start_indent: int | None = None) -> L
     )
 
 
+@lru_cache(maxsize=256)
+def get_marker_width(marker_stripped: str) -> int:
+    """Get the width of the marker itself, without trailing whitespace.
+
+    Equivalent to ``len(marker_stripped.split()[0])`` (1 for an empty
+    marker) without allocating the split list.
+
+    Args:
+        marker_stripped: Marker value with leading whitespace stripped
+
+    Returns:
+        Length of the first whitespace-delimited run, or 1 if empty
+
+    """
+    for i, ch in enumerate(marker_stripped):
+        if ch.isspace():
+            return i or 1
+    return len(marker_stripped) or 1
+
+
 def is_list_marker(text: str) -> bool:
     """Check if text starts with a list marker pattern.
 
@@ -102,24 +172,30 @@ def is_list_marker(text: str) -> bool:
         True if text starts with a valid list marker
 
     """
-    if not text:
-        return False
+    return _LIST_MARKER_RE.match(text) is not None
 
-    first_char = text[0]
 
-    # Unordered: -, *, + followed by space/tab or end of line
-    if first_char in "-*+":
-        return len(text) == 1 or (len(text) > 1 and text[1] in " \t")
+def classify_indented_content(content: str) -> int:
+    """Classify stripped INDENTED_CODE content by the block it would start.
 
-    # Ordered: digits followed by . or ) and space/tab or end of line
-    if first_char.isdigit():
-        pos = 0
-        while pos < len(text) and text[pos].isdigit():
-            pos += 1
-        if pos > 0 and pos < len(text) and text[pos] in ".)":
-            return pos + 1 == len(text) or (pos + 1 < len(text) and text[pos + 1] in " \t")
+    Lets the blank-line handler classify a token once and hand the result
+    to the list item loop instead of both re-running the string checks.
+    The INDENTED_CODE handler uses it for the same dispatch.
 
-    return False
+    Args:
+        content: Token content with leading whitespace stripped
+
+    Returns:
+        One of CONTENT_LIST_MARKER, CONTENT_BLOCK_QUOTE, CONTENT_FENCE,
+        or 0 for plain content
+
+    """
+    first = content[:1]
+    if first == ">":
+        return CONTENT_BLOCK_QUOTE
+    if first == "`" or first == "~":
+        return CONTENT_FENCE if content.startswith(("```", "~~~")) else 0
+    return CONTENT_LIST_MARKER if _LIST_MARKER_RE.match(content) is not None else 0
 
 
 def is_same_list_type(
@@ -134,6 +210,9 @@ def is_same_list_type(
     - Unordered: -, *, + are different lists
     - Ordered: . and ) are different lists
 
+    The parser uses build_same_list_matcher(); this plain version is the
+    reference that matcher is tested against.
+
     Args:
         marker_value: The raw marker value from the token
         ordered: Whether the current list is ordered
@@ -144,24 +223,52 @@ def is_same_list_type(
         True if the marker belongs to the same list
 
     """
-    marker_stripped = marker_value.lstrip()
+    marker_stripped = marker_value.lstrip(" \t")
     if not marker_stripped:
         return False
 
-    is_ordered = marker_stripped[0].isdigit()
+    is_ordered = "0" <= marker_stripped[0] <= "9"
     if is_ordered != ordered:
         return False
 
     if ordered:
         # Extract marker character from ordered list
         for c in marker_stripped:
-            if not c.isdigit():
+            if not "0" <= c <= "9":
                 return c == ordered_marker_char
         return False
     else:
         return marker_stripped[0] == bullet_char
 
 
+@lru_cache(maxsize=32)
+def build_same_list_matcher(
+    ordered: bool,
+    bullet_char: str,
+    ordered_marker_char: str,
+) -> Callable[[str], re.Match[str] | None]:
+    """Build a matcher accepting markers that continue the given list.
+
+    Equivalent to ``is_same_list_type`` with the list's type fixed, so a list
+    can build it once when it opens and test each candidate marker with a
+    single anchored match. The patterns are linear (no nested quantifiers).
+
+    Args:
+        ordered: Whether the list is ordered
+        bullet_char: The list's bullet character (for unordered)
+        ordered_marker_char: The list's marker character (for ordered)
+
+    Returns:
+        A ``match`` callable; a non-None result means same list type
+
+    """
+    if ordered:
+        pattern = r"[ \t]*[0-9]+" + re.escape(ordered_marker_char)
+    else:
+        pattern = r"[ \t]*" + re.escape(bullet_char)
+    return re.compile(pattern).match
+
+
 def extract_task_marker(line: str) -> tuple[bool | None, str]:
     """Extract task list marker from line content.
 
@@ -175,8 +282,7 @@ def extract_task_marker(line: str) -> tuple[bool | None, str]:
         - checked is None if no task marker
 
     """
-    if line.startswith("[ ] "):
-        return (False, line[4:])
-    elif line.startswith(("[x] ", "[X] ")):
-        return (True, line[4:])
-    return (None, line)
+    checked = _TASK_PREFIXES.get(line[:4])
+    if checked is None:
+        return (None, line)
+    return (checked, line[4:])
@@ -29,6 +29,7 @@ from patitas.parsing.blocks.list.blank_line import (
     handle_blank_line,
 )
 from patitas.parsing.blocks.list.indent import (
+    count_whitespace_columns,
     is_nested_list_indent,
 )
 from patitas.parsing.blocks.list.item_blocks import (
@@ -39,22 +40,23 @@ from patitas.parsing.blocks.list.item_blocks import (
     parse_indented_code_in_list,
 )
 from patitas.parsing.blocks.list.marker import (
+    CONTENT_BLOCK_QUOTE,
+    CONTENT_FENCE,
+    CONTENT_LIST_MARKER,
+    build_same_list_matcher,
+    classify_indented_content,
     extract_marker_info,
     extract_task_marker,
     get_marker_indent,
-    is_list_marker,
-    is_same_list_type,
+    get_marker_width,
 )
 from patitas.parsing.blocks.list.nested import (
     detect_nested_block_in_content,
     parse_nested_list_from_indented_code,
     parse_nested_list_inline,
 )
-from patitas.parsing.containers import (
-    ContainerFrame,
-    ContainerType,
-)
-from patitas.parsing.protocols import ParserHost, TokenNavHost
+from patitas.parsing.containers import ContainerFrame
+from patitas.parsing.protocols import InlineParsingHost, ParserHost, TokenNavHost
 from patitas.tokens import TokenType
 
 if TYPE_CHECKING:
@@ -80,7 +82,6 @@ class ListParsingMixin:
         - _parse_inline(text, location) -> tuple[Inline, ...]
         - _parse_block() -> Block | None
         - _get_line_at(offset) -> str
-        - _line_start_for_offset(offset: int) -> int
         - _strip_columns(text, count) -> str
 
     """
@@ -104,65 +105,47 @@ class ListParsingMixin:
         - Loose lists (blank lines between items)
         """
         start_token = self._current
-        assert start_token is not None and start_token.type == TokenType.LIST_ITEM_MARKER
+        assert start_token is not None and start_token.type is TokenType.LIST_ITEM_MARKER
 
         # Extract marker info
-        marker_info = extract_marker_info(start_token.value)
-        start_indent = marker_info.indent
-        ordered = marker_info.ordered
-        bullet_char = marker_info.bullet_char
-        ordered_marker_char = marker_info.ordered_marker_char
-        start = marker_info.start
+        ordered, bullet_char, ordered_marker_char, start, start_indent, marker_length = (
+            extract_marker_info(start_token.value)
+        )
+        list_type = (ordered, bullet_char, ordered_marker_char)
 
         # Calculate content indent
-        content_indent = start_indent + marker_info.marker_length + 1
+        content_indent = start_indent + marker_length + 1
 
-        # Track whether this list is nested inside a block quote
-        inside_block_quote = any(
-            frame.container_type == ContainerType.BLOCK_QUOTE for frame in self._containers._stack
-        )
+        containers = self._containers
 
         # Phase 2 Shadow Stack: Push LIST container frame
         # This tracks the list's indent context for validation.
         # In Phase 3, this will become the source of truth.
-        list_frame = ContainerFrame(
-            container_type=ContainerType.LIST,
-            start_indent=start_indent,
-            content_indent=content_indent,
-            marker_width=marker_info.marker_length,
-            ordered=ordered,
-            bullet_char=bullet_char,
-            start_number=start,
+        list_frame = ContainerFrame.new_list(
+            start_indent, content_indent, marker_length, ordered, bullet_char, start
         )
-        self._containers.push(list_frame)
+        containers.push(list_frame)
 
         items: list[ListItem] = []
+        items_append = items.append
 
-        while not self._at_end():
-            token = self._current
-            assert token is not None
-
+        while (token := self._current) is not None and token.type is not TokenType.EOF:
             # Handle blank lines between items (makes list loose)
-            if token.type == TokenType.BLANK_LINE:
+            if token.type is TokenType.BLANK_LINE:
                 # Phase 3.2: Use stack-based loose detection
-                self._containers.mark_loose()
-                while (
-                    not self._at_end()
-                    and (cur := self._current) is not None
-                    and cur.type == TokenType.BLANK_LINE
-                ):
-                    self._advance()
-                if self._at_end():
-                    break
+                containers.mark_loose()
+                self._skip_blank_lines()
+                # None/EOF also end the list: neither is a LIST_ITEM_MARKER
                 token = self._current
-                assert token is not None
-                if token.type != TokenType.LIST_ITEM_MARKER:
+                if token is None or token.type is not TokenType.LIST_ITEM_MARKER:
                     break
 
-            if token.type != TokenType.LIST_ITEM_MARKER:
+            if token.type is not TokenType.LIST_ITEM_MARKER:
                 break
 
-            current_indent = get_marker_indent(token.value)
+            # Cached per marker string: indent and list type in one lookup
+            info = extract_marker_info(token.value)
+            current_indent = info.indent
 
             # If less indented than our list, we're done
             if current_indent < start_indent:
@@ -173,15 +156,14 @@ class ListParsingMixin:
                 break
 
             # Check if same list type
-            if not is_same_list_type(token.value, ordered, bullet_char, ordered_marker_char):
+            if info[:3] != list_type:
                 break
 
             self._advance()
 
             # Update content indent for this item
             current_marker = token.value.lstrip()
-            parts = current_marker.split()
-            current_marker_length = len(parts[0]) if parts else 1
+            current_marker_length = get_marker_width(current_marker)
             content_indent = current_indent + current_marker_length + 1
 
             # Parse item content
@@ -194,48 +176,41 @@ class ListParsingMixin:
                 ordered_marker_char,
                 current_marker,
             )
-            items.append(item)
+            items_append(item)
 
         # Phase 3.2: Read tight/loose from stack before popping
         # Looseness is now tracked in the stack and propagates from child
         # containers via pop(). If is_loose is True, the list is loose.
-        tight = not self._containers.current().is_loose
-        self._containers.pop()
-
-        # Normalize misclassified indented code only when inside block quote
-        if not inside_block_quote:
-            final_items = items
-        else:
-            normalized_items: list[ListItem] = []
-            for item in items:
-                fixed_children = []
-                for child in item.children:
-                    if (
-                        isinstance(child, IndentedCode)
-                        and child.location.col_offset <= content_indent
-                    ):
-                        text = child.code.rstrip("\n")
-                        inlines = self._parse_inline(text, child.location)
-                        fixed_children.append(Paragraph(location=child.location, children=inlines))
-                    else:
-                        fixed_children.append(child)
-                normalized_items.append(
-                    ListItem(
-                        location=item.location,
-                        children=tuple(fixed_children),
-                        checked=item.checked,
-                    )
-                )
-            final_items = normalized_items
+        tight = not list_frame.is_loose
+        containers.pop()
 
         return List(
             location=start_token.location,
-            items=tuple(final_items),
+            items=tuple(items),
             ordered=ordered,
             start=start,
             tight=tight,
         )
 
+    def _reclassify_block_quote_code(
+        self: InlineParsingHost, children: list[Block], content_indent: int
+    ) -> list[Block]:
+        """Re-read IndentedCode children at or before content_indent as paragraphs.
+
+        Only items nested inside a block quote can misclassify content this
+        way, so _parse_list_item_impl calls this off its common path, once per
+        item, before the ListItem is built.
+        """
+        fixed_children: list[Block] = []
+        for child in children:
+            if isinstance(child, IndentedCode) and child.location.col_offset <= content_indent:
+                text = child.code.rstrip("\n")
+                inlines = self._parse_inline(text, child.location)
+                fixed_children.append(Paragraph(location=child.location, children=inlines))
+            else:
+                fixed_children.append(child)
+        return fixed_children
+
     def _parse_list_item(
         self: ParserHost,
         marker_token: Token,
@@ -296,123 +271,55 @@ class ListParsingMixin:
             ListItem node
         """
         # Phase 2 Shadow Stack: Push LIST_ITEM container frame
-        item_frame = ContainerFrame(
-            container_type=ContainerType.LIST_ITEM,
-            start_indent=start_indent,
-            content_indent=content_indent,
-        )
-        self._containers.push(item_frame)
+        containers = self._containers
+        containers.push_list_item(start_indent, content_indent)
+        same_list_type = build_same_list_matcher(ordered, bullet_char, ordered_marker_char)
+        # Fixed for the whole item: nested parsing never opens a block quote here
+        in_block_quote = containers._bq_depth > 0
 
         item_children: list[Block] = []
         content_lines: list[str] = []
+        # Both buffers live for the whole item (flushes clear them in place)
+        children_append = item_children.append
+        lines_append = content_lines.append
+        advance = self._advance
         checked: bool | None = None
         actual_content_indent: int | None = None
         saw_paragraph_content = False
 
-        while not self._at_end():
-            tok = self._current
-            assert tok is not None
-
-            # INDENTED_CODE at content indent inside block quotes should behave like
-            # paragraph continuation, not code (CommonMark 259/260).
-            if tok.type == TokenType.INDENTED_CODE and any(
-                frame.container_type == ContainerType.BLOCK_QUOTE
-                for frame in self._containers._stack
-            ):
-                indent_beyond = tok.line_indent - content_indent
-                if indent_beyond < 4:
-                    content_lines.append(tok.value.lstrip())
-                    saw_paragraph_content = True
-                    self._advance()
-                    continue
-                content_lines.append(tok.value.lstrip())
-                saw_paragraph_content = True
-                self._advance()
-                continue
-
-            # Handle thematic break
-            if tok.type == TokenType.THEMATIC_BREAK:
-                # Setext underline inside list item (CommonMark example 300)
-                if (
-                    saw_paragraph_content
-                    and content_lines
-                    and tok.line_indent >= content_indent
-                    and tok.value.strip()
-                    and all(c == "-" for c in tok.value.strip())
-                ):
-                    heading_text = "\n".join(content_lines).rstrip()
-                    children = self._parse_inline(heading_text, marker_token.location)
-                    item_children.append(
-                        Heading(
-                            location=marker_token.location,
-                            level=2,
-                            children=children,
-                            style="setext",
-                        )
-                    )
-                    content_lines = []
-                    saw_paragraph_content = False
-                    self._advance()
-                    continue
-                block, should_continue = handle_thematic_break(
-                    tok, saw_paragraph_content, bool(content_lines), self
-                )
-                if block:
-                    item_children.append(block)
-                if not should_continue:
-                    break
-                continue
-
-            # Handle fenced code immediately after marker (no prior content)
-            if (
-                tok.type == TokenType.FENCED_CODE_START
-                and not saw_paragraph_content
-                and not content_lines
-            ):
-                block, should_continue = handle_fenced_code_immediate(
-                    tok, saw_paragraph_content, bool(content_lines), content_indent, self
-                )
-                if block:
-                    item_children.append(block)
-                if not should_continue:
-                    break
-                continue
-
+        while (tok := self._current) is not None and (tok_type := tok.type) is not TokenType.EOF:
             # Handle paragraph content
-            if tok.type == TokenType.PARAGRAPH_LINE:
+            if tok_type is TokenType.PARAGRAPH_LINE:
                 # Treat single-line HTML tags as HTML blocks inside list items (CommonMark 175)
                 stripped_line = tok.value.lstrip()
                 if stripped_line.startswith("<"):
                     # Simple tag name extraction (letters/digits/hyphen)
-                    tag = ""
-                    idx = 1
-                    if idx < len(stripped_line) and stripped_line[idx] == "/":
-                        idx += 1
-                    while idx < len(stripped_line) and (
-                        stripped_line[idx].isalnum() or stripped_line[idx] == "-"
+                    line_len = len(stripped_line)
+                    idx = 2 if stripped_line.startswith("</") else 1
+                    end = idx
+                    while end < line_len and (
+                        stripped_line[end].isalnum() or stripped_line[end] == "-"
                     ):
-                        tag += stripped_line[idx].lower()
-                        idx += 1
+                        end += 1
+                    tag = stripped_line[idx:end].lower()
                     if tag in HTML_BLOCK_TYPE1_TAGS or tag in HTML_BLOCK_TYPE6_TAGS:
                         html_content = tok.value
                         if not html_content.endswith("\n"):
                             html_content += "\n"
-                        item_children.append(HtmlBlock(location=tok.location, html=html_content))
+                        children_append(HtmlBlock(location=tok.location, html=html_content))
                         saw_paragraph_content = False
-                        self._advance()
+                        advance()
                         continue
 
                 # CommonMark: If first content line has more than 4 spaces between
                 # marker and content, treat it as indented code, not paragraph.
                 # We count effective column width (with tabs expanded) from the
                 # marker character (like "." or "-") to the first content character.
+                # The source line is kept for the content indent calculation below.
+                original_line: str | None = None
                 if actual_content_indent is None and not content_lines:
                     # Find the original line containing this content
-                    line_start = self._line_start_for_offset(tok.location.offset)
-                    line_end = self._source.find("\n", tok.location.offset)
-                    if line_end == -1:
-                        line_end = len(self._source)
-                    original_line = self._source[line_start:line_end]
+                    original_line = self._get_line_at(tok.location.offset)
 
                     # Get just the marker character (e.g., "-" or "1.")
                     marker_char = marker_stripped.rstrip()
@@ -422,38 +329,12 @@ class ListParsingMixin:
                         # Calculate effective column width with tabs expanded
                         after_marker = original_line[marker_pos + len(marker_char) :]
                         # Count effective spaces (expand tabs to tab stops)
-                        spaces_after_marker = 0
-                        col = marker_pos + len(marker_char)  # Column after marker (0-indexed)
-                        for ch in after_marker:
-                            if ch == " ":
-                                spaces_after_marker += 1
-                                col += 1
-                            elif ch == "\t":
-                                # Tab expands to next tab stop (tab stops every 4 columns)
-                                tab_width = 4 - (col % 4)
-                                spaces_after_marker += tab_width
-                                col += tab_width
-                            else:
-                                break  # Non-whitespace character
+                        spaces_after_marker = count_whitespace_columns(
+                            after_marker, marker_pos + len(marker_char)
+                        )
                     else:
                         # Fallback: use token value leading spaces (with tab expansion)
-                        spaces_after_marker = 0
-                        col = 0
-                        for ch in tok.value:
-                            if ch == " ":
-                                spaces_after_marker += 1
-                                col += 1
-                            elif ch == "\t":
-                                tab_width = 4 - (col % 4)
-                                spaces_after_marker += tab_width
-                                col += tab_width
-                            else:
-                                break
-
-                    in_block_quote = any(
-                        frame.container_type == ContainerType.BLOCK_QUOTE
-                        for frame in self._containers._stack
-                    )
+                        spaces_after_marker = count_whitespace_columns(tok.value)
 
                     if spaces_after_marker > 4 and not in_block_quote:
                         # This is indented code - extract from original line,
@@ -463,6 +344,10 @@ class ListParsingMixin:
                         cols_to_strip = 5  # 1 for marker space + 4 for indented code
                         col = marker_pos + len(marker_char)  # Start column after marker
                         pos = 0
+                        if remaining_content.startswith("     "):
+                            # Tab-free prefix: the 5 columns are exactly 5 spaces
+                            pos = cols_to_strip
+                            col += cols_to_strip
                         while (
                             pos < len(remaining_content)
                             and col < marker_pos + len(marker_char) + cols_to_strip
@@ -489,19 +374,19 @@ class ListParsingMixin:
                             else:
                                 break
                         code_content = remaining_content[pos:].rstrip() + "\n"
-                        item_children.append(IndentedCode(location=tok.location, code=code_content))
+                        children_append(IndentedCode(location=tok.location, code=code_content))
                         # Set actual_content_indent to marker_end + 1 (CommonMark rule)
                         actual_content_indent = content_indent
-                        self._containers.update_content_indent(actual_content_indent)
-                        self._advance()
+                        containers.update_content_indent(actual_content_indent)
+                        advance()
                         continue
 
-                line = tok.value.lstrip()
+                line = stripped_line
 
                 # Skip whitespace-only lines immediately after marker (test 279)
                 # These are from trailing whitespace on the marker line
                 if not line and not content_lines and not saw_paragraph_content:
-                    self._advance()
+                    advance()
                     continue
 
                 # Check for nested list marker at start of content
@@ -519,28 +404,36 @@ class ListParsingMixin:
                             self,
                         )
                         item_children.extend(blocks)
-                        self._advance()
+                        advance()
                         continue
 
                 # Calculate actual content indent from first line
                 if actual_content_indent is None:
                     actual_content_indent = self._calculate_actual_content_indent(
-                        tok, marker_stripped
+                        tok, marker_stripped, original_line
                     )
                     # Phase 3: Update the stack frame with actual content indent
                     # This enables find_owner() to use the correct value
-                    self._containers.update_content_indent(actual_content_indent)
+                    containers.update_content_indent(actual_content_indent)
 
                 # Check for task list marker
                 if not content_lines and checked is None:
                     checked, line = extract_task_marker(line)
 
-                content_lines.append(line)
+                lines_append(line)
                 saw_paragraph_content = True
-                self._advance()
+                advance()
 
             # Handle indented code
-            elif tok.type == TokenType.INDENTED_CODE:
+            elif tok_type is TokenType.INDENTED_CODE:
+                # INDENTED_CODE inside block quotes is paragraph continuation,
+                # not code (CommonMark 259/260).
+                if in_block_quote:
+                    lines_append(tok.value.lstrip())
+                    saw_paragraph_content = True
+                    advance()
+                    continue
+
                 # Phase 4: Simplified signature - stack provides indent context
                 result = self._handle_indented_code_in_item(
                     tok,
@@ -556,29 +449,20 @@ class ListParsingMixin:
                     content_lines, item_children = result
 
             # Handle blank line
-            elif tok.type == TokenType.BLANK_LINE:
+            elif tok_type is TokenType.BLANK_LINE:
                 # CommonMark test 280: Blank line immediately after empty marker
                 # creates an empty list item and ends it
                 if not content_lines and not item_children and not saw_paragraph_content:
                     # Empty item - don't consume the blank line, let parent handle it
                     break
 
-                self._advance()
-                # Consume consecutive blank lines
-                while (
-                    not self._at_end()
-                    and (cur := self._current) is not None
-                    and cur.type == TokenType.BLANK_LINE
-                ):
-                    self._advance()
-
-                if self._at_end():
-                    break
+                # Consume this and any consecutive blank lines
+                self._skip_blank_lines()
 
-                # Phase 4: Use stack-based blank line handling
+                # Phase 4: Use stack-based blank line handling (None/EOF end the list)
                 result = handle_blank_line(
                     self._current,
-                    self._containers,
+                    containers,
                 )
 
                 if isinstance(result, EndList):
@@ -586,92 +470,77 @@ class ListParsingMixin:
                 elif isinstance(result, EndItem):
                     # Phase 3.2: Blank line before sibling item = parent list is loose
                     # We're in LIST_ITEM, so mark parent LIST as loose
-                    self._containers.mark_parent_list_loose()
+                    containers.mark_parent_list_loose()
                     break
                 elif isinstance(result, ContinueList):
                     if result.is_loose:
                         # Phase 3.2: Use stack-based loose detection
-                        self._containers.mark_loose()
+                        containers.mark_loose()
                     if result.save_paragraph and content_lines:
-                        content = "\n".join(content_lines)
-                        inlines = self._parse_inline(content, marker_token.location)
-                        item_children.append(
-                            Paragraph(location=marker_token.location, children=inlines)
-                        )
-                        content_lines = []
-                    self._advance()
+                        self._flush_item_paragraph(content_lines, marker_token, item_children)
+                    advance()
                     continue
                 elif isinstance(result, ParseBlock):
                     # Phase 3.2: Use stack-based loose detection
-                    self._containers.mark_loose()
+                    containers.mark_loose()
                     if content_lines:
-                        content = "\n".join(content_lines)
-                        inlines = self._parse_inline(content, marker_token.location)
-                        item_children.append(
-                            Paragraph(location=marker_token.location, children=inlines)
-                        )
-                        content_lines = []
+                        self._flush_item_paragraph(content_lines, marker_token, item_children)
 
                     # Phase 5: Handle INDENTED_CODE specially within list context
                     # The lexer marks 4+ spaces as INDENTED_CODE, but within a list
                     # item, we need to re-interpret based on content_indent
                     next_tok = self._current
-                    if next_tok and next_tok.type == TokenType.INDENTED_CODE:
+                    if next_tok and next_tok.type is TokenType.INDENTED_CODE:
                         check_indent = (
                             actual_content_indent
                             if actual_content_indent is not None
                             else content_indent
                         )
-                        stripped = next_tok.value.lstrip().rstrip()
+                        kind = result.content_kind
                         indent_beyond = next_tok.line_indent - check_indent
 
                         # Nested list marker at content indent
-                        if is_list_marker(stripped):
+                        if kind & CONTENT_LIST_MARKER:
                             nested_list = parse_nested_list_from_indented_code(
                                 next_tok, next_tok.line_indent, check_indent, self
                             )
                             if nested_list:
-                                item_children.append(nested_list)
+                                children_append(nested_list)
                             continue
 
                         # Block quote at content indent
-                        if stripped.startswith(">"):
+                        if kind & CONTENT_BLOCK_QUOTE:
                             bq = parse_block_quote_from_indented_code(next_tok, self, check_indent)
-                            item_children.append(bq)
+                            children_append(bq)
                             continue
 
                         # Fenced code at content indent
-                        if stripped.startswith(("```", "~~~")):
+                        if kind & CONTENT_FENCE:
                             fc = parse_fenced_code_from_indented_code(next_tok, self, check_indent)
-                            item_children.append(fc)
+                            children_append(fc)
                             continue
 
                         # Actual indented code (4+ beyond content_indent)
                         if indent_beyond >= 4:
                             ic = parse_indented_code_in_list(next_tok, self, check_indent)
-                            item_children.append(ic)
+                            children_append(ic)
                             continue
 
                     # Default: use standard block parsing
                     block = self._parse_block()
                     if block is not None:
-                        item_children.append(block)
+                        children_append(block)
                     continue
                 elif isinstance(result, ParseContinuation):
                     # Phase 3.2: Use stack-based loose detection
-                    self._containers.mark_loose()
+                    containers.mark_loose()
                     if result.save_paragraph and content_lines:
-                        content = "\n".join(content_lines)
-                        inlines = self._parse_inline(content, marker_token.location)
-                        item_children.append(
-                            Paragraph(location=marker_token.location, children=inlines)
-                        )
-                        content_lines = []
+                        self._flush_item_paragraph(content_lines, marker_token, item_children)
 
                     # Handle continuation content directly
                     # INDENTED_CODE at content indent is paragraph content, not code
                     next_tok = self._current
-                    if next_tok and next_tok.type == TokenType.INDENTED_CODE:
+                    if next_tok and next_tok.type is TokenType.INDENTED_CODE:
                         check_indent = (
                             actual_content_indent
                             if actual_content_indent is not None
@@ -684,97 +553,137 @@ class ListParsingMixin:
                         if orig_indent >= check_indent and indent_beyond < 4:
                             # Strip leading whitespace - lexer already removed 4 spaces,
                             # but content at content_indent should have no leading space
-                            content_lines.append(next_tok.value.strip())
-                            self._advance()
+                            lines_append(next_tok.value.strip())
+                            advance()
                             continue
-                    elif next_tok and next_tok.type == TokenType.PARAGRAPH_LINE:
+                    elif next_tok and next_tok.type is TokenType.PARAGRAPH_LINE:
                         # Continuation paragraph
-                        content_lines.append(next_tok.value.lstrip())
-                        self._advance()
+                        lines_append(next_tok.value.lstrip())
+                        advance()
                         continue
 
                     continue
 
             # Handle nested list markers
-            elif tok.type == TokenType.LIST_ITEM_MARKER:
+            elif tok_type is TokenType.LIST_ITEM_MARKER:
                 nested_indent = get_marker_indent(tok.value)
                 check_content_indent = (
                     actual_content_indent if actual_content_indent is not None else content_indent
                 )
 
                 # Check if different marker at same indent (new list)
-                if nested_indent == start_indent and not is_same_list_type(
-                    tok.value, ordered, bullet_char, ordered_marker_char
-                ):
+                if nested_indent == start_indent and same_list_type(tok.value) is None:
                     break
 
                 if is_nested_list_indent(nested_indent, check_content_indent):
                     # Save current paragraph
                     if content_lines:
-                        content = "\n".join(content_lines)
-                        inlines = self._parse_inline(content, marker_token.location)
-                        item_children.append(
-                            Paragraph(location=marker_token.location, children=inlines)
-                        )
-                        content_lines = []
+                        self._flush_item_paragraph(content_lines, marker_token, item_children)
 
                     # Parse nested list
                     nested_list = self._parse_list(parent_indent=start_indent)
-                    item_children.append(nested_list)
+                    children_append(nested_list)
 
                     # After nested list, check if there's a blank line before the next token
                     # This makes the outer list loose
-                    if not self._at_end():
-                        next_tok = self._current
-                        assert next_tok is not None
-                        # Check if there was a blank line before current token by looking at source
-                        if next_tok.location.offset > 0:
-                            # Find the line start
-                            line_start = self._line_start_for_offset(next_tok.location.offset)
-                            if line_start > 1:
-                                prev_char = self._source[line_start - 2 : line_start]
-                                if prev_char == "\n\n" or (
-                                    line_start >= 2
-                                    and self._source[line_start - 1] == "\n"
-                                    and self._source[line_start - 2] == "\n"
-                                ):
-                                    # There was a blank line before this token
-                                    # Phase 3.2: Use stack-based loose detection
-                                    self._containers.mark_loose()
-
-                        if next_tok.type == TokenType.PARAGRAPH_LINE:
+                    next_tok = self._current
+                    if next_tok is not None and next_tok.type is not TokenType.EOF:
+                        # The nested list consumed any blank lines it ended on, so the
+                        # token just behind us says whether one preceded next_tok
+                        if self._tokens[self._pos - 1].type is TokenType.BLANK_LINE:
+                            # Only a sibling item or content at the content indent
+                            # continues past the blank line
+                            if next_tok.type is TokenType.LIST_ITEM_MARKER:
+                                next_indent = get_marker_indent(next_tok.value)
+                                continues = next_indent >= check_content_indent or (
+                                    next_indent >= start_indent
+                                    and same_list_type(next_tok.value) is not None
+                                )
+                            else:
+                                continues = next_tok.line_indent >= check_content_indent
+                            if not continues:
+                                # Blank lines ending an item do not make the list loose
+                                break
+                            # Phase 3.2: Use stack-based loose detection
+                            containers.mark_loose()
+
+                        if next_tok.type is TokenType.PARAGRAPH_LINE:
                             next_indent = next_tok.line_indent
                             # Content at outer item's content indent = continuation
                             # Use content_indent (not check_content_indent) for comparison
                             if next_indent >= start_indent and next_indent <= content_indent:
                                 # Blank line occurred (nested list ended), making list loose
                                 # Phase 3.2: Use stack-based loose detection
-                                self._containers.mark_loose()
-                                content_lines.append(next_tok.value.lstrip())
-                                self._advance()
+                                containers.mark_loose()
+                                lines_append(next_tok.value.lstrip())
+                                advance()
                                 continue
                 elif nested_indent >= 4 and nested_indent < check_content_indent:
                     # Marker at 4+ spaces but not nested - literal content
                     marker_content = tok.value.lstrip()
-                    self._advance()
-                    if not self._at_end():
-                        next_tok = self._current
-                        assert next_tok is not None
-                        if next_tok.type == TokenType.PARAGRAPH_LINE:
-                            marker_content += " " + next_tok.value.lstrip()
-                            self._advance()
-                    content_lines.append(marker_content)
+                    next_tok = advance()
+                    if next_tok is not None and next_tok.type is TokenType.PARAGRAPH_LINE:
+                        marker_content += " " + next_tok.value.lstrip()
+                        advance()
+                    lines_append(marker_content)
                 else:
                     # Sibling item
                     break
 
+            # Handle thematic break
+            elif tok_type is TokenType.THEMATIC_BREAK:
+                # Setext underline inside list item (CommonMark example 300)
+                if (
+                    saw_paragraph_content
+                    and content_lines
+                    and tok.line_indent >= content_indent
+                    and (rule := tok.value.strip())
+                    and not rule.strip("-")
+                ):
+                    heading_text = "\n".join(content_lines).rstrip()
+                    children = self._parse_inline(heading_text, marker_token.location)
+                    children_append(
+                        Heading(
+                            location=marker_token.location,
+                            level=2,
+                            children=children,
+                            style="setext",
+                        )
+                    )
+                    content_lines.clear()
+                    saw_paragraph_content = False
+                    advance()
+                    continue
+                block, should_continue = handle_thematic_break(
+                    tok, saw_paragraph_content, bool(content_lines), self
+                )
+                if block:
+                    children_append(block)
+                if not should_continue:
+                    break
+                continue
+
             # Handle block-level elements at content indent
-            elif tok.type in (
+            elif tok_type in (
                 TokenType.BLOCK_QUOTE_MARKER,
                 TokenType.FENCED_CODE_START,
                 TokenType.ATX_HEADING,
-                TokenType.THEMATIC_BREAK,
             ):
+                # Fenced code immediately after marker (no prior content)
+                if (
+                    tok_type is TokenType.FENCED_CODE_START
+                    and not saw_paragraph_content
+                    and not content_lines
+                ):
+                    block, should_continue = handle_fenced_code_immediate(
+                        tok, saw_paragraph_content, bool(content_lines), content_indent, self
+                    )
+                    if block:
+                        children_append(block)
+                    if not should_continue:
+                        break
+                    continue
+
                 # Check if the block element is at content indent
                 block_indent = tok.line_indent
                 check_content_indent = (
@@ -783,15 +692,10 @@ class ListParsingMixin:
                 if block_indent >= check_content_indent:
                     # Block element belongs to this item
                     if content_lines:
-                        content = "\n".join(content_lines)
-                        inlines = self._parse_inline(content, marker_token.location)
-                        item_children.append(
-                            Paragraph(location=marker_token.location, children=inlines)
-                        )
-                        content_lines = []
+                        self._flush_item_paragraph(content_lines, marker_token, item_children)
                     block = self._parse_block()
                     if block is not None:
-                        item_children.append(block)
+                        children_append(block)
                     continue
                 else:
                     # Block element is at list level - terminates item
@@ -802,14 +706,16 @@ class ListParsingMixin:
 
         # Finalize item content
         if content_lines:
-            content = "\n".join(content_lines)
-            inlines = self._parse_inline(content, marker_token.location)
-            item_children.append(Paragraph(location=marker_token.location, children=inlines))
+            self._flush_item_paragraph(content_lines, marker_token, item_children)
+
+        # Normalize misclassified indented code only when inside block quote
+        if in_block_quote:
+            item_children = self._reclassify_block_quote_code(item_children, content_indent)
 
         # Phase 3.2: Pop the LIST_ITEM container frame
         # Looseness is tracked in the stack via mark_loose() calls.
-        # The pop() will propagate looseness to the parent LIST frame.
-        self._containers.pop()
+        # The pop will propagate looseness to the parent LIST frame.
+        containers.pop_list_item()
 
         return ListItem(
             location=marker_token.location,
@@ -817,8 +723,25 @@ class ListParsingMixin:
             checked=checked,
         )
 
+    def _flush_item_paragraph(
+        self: InlineParsingHost,
+        content_lines: list[str],
+        marker_token: Token,
+        item_children: list[Block],
+    ) -> None:
+        """Close the pending paragraph of a list item.
+
+        Joins and inline-parses the buffered lines once, appends the
+        Paragraph to item_children, and empties content_lines in place so
+        the caller keeps buffering into the same list.
+        """
+        content = "\n".join(content_lines)
+        inlines = self._parse_inline(content, marker_token.location)
+        item_children.append(Paragraph(location=marker_token.location, children=inlines))
+        content_lines.clear()
+
     def _calculate_actual_content_indent(
-        self: TokenNavHost, tok: Token, marker_stripped: str
+        self: TokenNavHost, tok: Token, marker_stripped: str, original_line: str | None = None
     ) -> int:
         """Calculate actual content indent from first content line.
 
@@ -828,16 +751,14 @@ class ListParsingMixin:
 
         For example, in "1. a", the marker "1." ends at column 2, followed by
         a space, so content starts at column 3. Content indent = 3.
+
+        Callers that already fetched tok's source line pass it as
+        original_line to skip the lookup.
         """
-        line_start = tok.location.offset
-        line_start_pos = self._line_start_for_offset(line_start)
-        end = self._source.find("\n", line_start_pos)
-        original_line = (
-            self._source[line_start_pos:end] if end != -1 else self._source[line_start_pos:]
-        )
+        if original_line is None:
+            original_line = self._get_line_at(tok.location.offset)
 
-        parts = marker_stripped.split()
-        marker_part = parts[0] if parts else marker_stripped
+        marker_part = marker_stripped[: get_marker_width(marker_stripped)]
         marker_pos_in_line = original_line.find(marker_part)
         if marker_pos_in_line == -1:
             return get_marker_indent(tok.value) + len(marker_part) + 1
@@ -882,22 +803,18 @@ class ListParsingMixin:
             (content_lines, item_children) - updated state
         """
         original_indent = tok.line_indent
-        stripped_content = tok.value.lstrip()
 
         # Phase 4: Use container stack as source of truth
-        current_frame = self._containers.current()
-        check_indent = current_frame.content_indent
+        check_indent = self._containers.current().content_indent
 
         if original_indent >= check_indent:
+            # One first-character dispatch instead of a regex plus two prefix checks
+            kind = classify_indented_content(tok.value.lstrip())
+
             # Check for nested list marker
-            if is_list_marker(stripped_content):
+            if kind & CONTENT_LIST_MARKER:
                 if content_lines:
-                    content = "\n".join(content_lines)
-                    inlines = self._parse_inline(content, marker_token.location)
-                    item_children.append(
-                        Paragraph(location=marker_token.location, children=inlines)
-                    )
-                    content_lines = []
+                    self._flush_item_paragraph(content_lines, marker_token, item_children)
 
                 nested_list = parse_nested_list_from_indented_code(
                     tok, original_indent, check_indent, self
@@ -907,28 +824,17 @@ class ListParsingMixin:
                 return (content_lines, item_children)
 
             # Check for block quote at content indent
-            stripped = stripped_content.rstrip()
-            if stripped.startswith(">"):
+            if kind & CONTENT_BLOCK_QUOTE:
                 if content_lines:
-                    content = "\n".join(content_lines)
-                    inlines = self._parse_inline(content, marker_token.location)
-                    item_children.append(
-                        Paragraph(location=marker_token.location, children=inlines)
-                    )
-                    content_lines = []
+                    self._flush_item_paragraph(content_lines, marker_token, item_children)
                 bq = parse_block_quote_from_indented_code(tok, self, check_indent)
                 item_children.append(bq)
                 return (content_lines, item_children)
 
             # Check for fenced code at content indent
-            if stripped.startswith(("```", "~~~")):
+            if kind & CONTENT_FENCE:
                 if content_lines:
-                    content = "\n".join(content_lines)
-                    inlines = self._parse_inline(content, marker_token.location)
-                    item_children.append(
-                        Paragraph(location=marker_token.location, children=inlines)
-                    )
-                    content_lines = []
+                    self._flush_item_paragraph(content_lines, marker_token, item_children)
                 fc = parse_fenced_code_from_indented_code(tok, self, check_indent)
                 item_children.append(fc)
                 return (content_lines, item_children)
@@ -944,12 +850,7 @@ class ListParsingMixin:
             indent_beyond = original_indent - check_indent
             if indent_beyond >= 4:
                 if content_lines:
-                    content = "\n".join(content_lines)
-                    inlines = self._parse_inline(content, marker_token.location)
-                    item_children.append(
-                        Paragraph(location=marker_token.location, children=inlines)
-                    )
-                    content_lines = []
+                    self._flush_item_paragraph(content_lines, marker_token, item_children)
                 # The lexer already stripped 4 spaces, strip remaining indent
                 code_content = tok.value.strip() + "\n"
                 item_children.append(IndentedCode(location=tok.location, code=code_content))
@@ -972,13 +873,6 @@ class ListParsingMixin:
 
         return "break"
 
-    def _get_marker_indent(self, marker_value: str) -> int:
-        """Extract indent level from list marker value.
-
-        Marker values are prefixed with spaces by the lexer to encode indent.
-        """
-        return get_marker_indent(marker_value)
-
     def _parse_nested_list_from_indented_code(
         self: ParserHost, token: Token, original_indent: int, parent_content_indent: int
     ) -> List | None:
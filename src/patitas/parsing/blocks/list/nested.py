@@ -10,14 +10,62 @@ from patitas.nodes import List, ListItem, Paragraph
 from patitas.parsing.blocks.list.marker import (
     is_list_marker,
 )
+from patitas.parsing.charsets import (
+    BLOCK_QUOTE_MARKER,
+    DIGITS,
+    THEMATIC_BREAK_CHARS,
+    UNORDERED_LIST_MARKERS,
+)
 from patitas.tokens import TokenType
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from patitas.nodes import Block
     from patitas.parsing.protocols import ParserHost as ParserProtocol
     from patitas.tokens import Token
 
 
+# Block kinds a first character can open, as bit flags
+_STARTS_LIST = 1
+_STARTS_BLOCK_QUOTE = 2
+_STARTS_ATX = 4
+_STARTS_THEMATIC_BREAK = 8
+
+
+def _build_nested_block_starters() -> dict[str, int]:
+    """Map each first character to the block kinds it can start."""
+    starters: dict[str, int] = {}
+    for chars, flag in (
+        (UNORDERED_LIST_MARKERS | DIGITS, _STARTS_LIST),
+        (BLOCK_QUOTE_MARKER, _STARTS_BLOCK_QUOTE),
+        ("#", _STARTS_ATX),
+        (THEMATIC_BREAK_CHARS, _STARTS_THEMATIC_BREAK),
+    ):
+        for char in chars:
+            starters[char] = starters.get(char, 0) | flag
+    return starters
+
+
+# One lookup answers both "can this start a block?" and "which checks apply?"
+_NESTED_BLOCK_STARTERS: dict[str, int] = _build_nested_block_starters()
+
+# First marker character -> ordered?; absent characters cannot start a marker
+_MARKER_ORDERED: dict[str, bool] = {
+    **dict.fromkeys(UNORDERED_LIST_MARKERS, False),
+    **dict.fromkeys(DIGITS, True),
+}
+
+# Characters a thematic break line may consist of, per break character;
+# stripping them leaves nothing exactly when the line has no other character
+_THEMATIC_BREAK_STRIP: dict[str, str] = {char: char + " \t" for char in THEMATIC_BREAK_CHARS}
+
+# Token types that can extend a list parsed out of indented code
+_NESTED_CONTINUATION_TYPES = frozenset(
+    {TokenType.INDENTED_CODE, TokenType.PARAGRAPH_LINE, TokenType.BLANK_LINE}
+)
+
+
 def detect_nested_block_in_content(
     line: str,
     line_indent: int,
@@ -39,47 +87,39 @@ def detect_nested_block_in_content(
         True if this should be parsed as a nested block
 
     """
-    if not line:
+    # Plain text is the common case: reject it on its first character
+    kind = _NESTED_BLOCK_STARTERS.get(line[:1], 0)
+    if not kind:
         return False
 
     # If line is indented 4+ spaces beyond content indent, it's literal text
     if line_indent >= content_indent + 4:
         return False
 
-    # Check for list markers
-    if is_list_marker(line):
+    if kind & _STARTS_BLOCK_QUOTE:
         return True
 
-    # Check for blockquote markers
-    if line.startswith(">"):
-        return True
-
-    # Check for ATX headings
-    if line.startswith("#"):
+    if kind & _STARTS_ATX:
         # Must be valid ATX heading (1-6 # followed by space or end of line)
-        pos = 0
-        while pos < len(line) and line[pos] == "#" and pos < 6:
-            pos += 1
-        if pos > 0 and (pos == len(line) or line[pos] in " \t"):
-            return True
-
-    # Check for thematic breaks
-    from patitas.parsing.charsets import THEMATIC_BREAK_CHARS
+        hashes = len(line) - len(line.lstrip("#"))
+        return hashes <= 6 and (hashes == len(line) or line[hashes] in " \t")
 
-    if line[0] in THEMATIC_BREAK_CHARS:
-        # Simplified thematic break check
-        stripped = line.replace(" ", "").replace("\t", "")
-        if len(stripped) >= 3 and all(c == stripped[0] for c in stripped):
-            return True
+    # Check for list markers (bullets and digits)
+    if kind & _STARTS_LIST and is_list_marker(line):
+        return True
 
-    return False
+    # Check for thematic breaks (simplified: 3+ of one char, only spaces/tabs between)
+    if not kind & _STARTS_THEMATIC_BREAK:
+        return False
+    first = line[0]
+    return line.count(first) >= 3 and not line.strip(_THEMATIC_BREAK_STRIP[first])
 
 
 def parse_nested_list_inline(
     line: str,
     token_location: object,
     parser: ParserProtocol,
-) -> list[Block]:
+) -> Sequence[Block]:
     """Parse a nested list from inline content.
 
     Used when a paragraph line turns out to be a nested list marker.
@@ -91,7 +131,7 @@ def parse_nested_list_inline(
         parser: The parser instance
 
     Returns:
-        List of parsed blocks
+        The sub-parser's blocks, passed through without copying
 
     Thread Safety:
         Nested parser reads config from the same ContextVar as parent,
@@ -105,8 +145,8 @@ def parse_nested_list_inline(
     nested_parser = Parser(line + "\n")
     # Carry nesting depth across the sub-parser boundary so the depth guard
     # cannot be reset (and bypassed) by nested list content.
-    nested_parser._nesting_depth = getattr(parser, "_nesting_depth", 0)
-    return list(nested_parser.parse())
+    nested_parser._nesting_depth = parser._nesting_depth
+    return nested_parser.parse()
 
 
 def parse_nested_list_from_indented_code(
@@ -164,44 +204,37 @@ def _parse_nested_list_from_indented_code_impl(
     stripped = token.value.lstrip()
 
     # Determine list type and extract marker info
-    first_char = stripped[0]
-    if first_char in "-*+":
-        ordered = False
-        marker_char = first_char
-        marker_len = 1
-        remaining = stripped[2:] if len(stripped) > 2 else ""
-    else:
-        ordered = True
-        pos = 0
-        while pos < len(stripped) and stripped[pos].isdigit():
-            pos += 1
-        marker_char = stripped[pos] if pos < len(stripped) else "."
-        marker_len = pos + 1
-        remaining = stripped[pos + 2 :] if pos + 2 < len(stripped) else ""
+    prefix = _split_marker(stripped)
+    assert prefix is not None  # callers only pass list-marker content
+    ordered, marker_char, marker_len = prefix
+    start = int(stripped[: marker_len - 1]) if ordered else 1
+    remaining = stripped[marker_len + 1 :]
 
     nested_content_indent = original_indent + marker_len + 1
 
     items: list[ListItem] = []
     tight = True
-    start = 1
-
-    if ordered:
-        num_str = ""
-        for c in stripped:
-            if c.isdigit():
-                num_str += c
-            else:
-                break
-        if num_str:
-            start = int(num_str)
 
     # Process first item
     first_item_children: list[Block] = []
-    if remaining.strip():
-        first_item_inlines = parser._parse_inline(remaining.strip(), token.location)
+    if first_text := remaining.strip():
+        first_item_inlines = parser._parse_inline(first_text, token.location)
         first_item_children.append(Paragraph(location=token.location, children=first_item_inlines))
 
-    parser._advance()
+    # Single-item list: nothing after the marker line can continue it
+    next_tok = parser._advance()
+    if next_tok is None or next_tok.type not in _NESTED_CONTINUATION_TYPES:
+        return List(
+            location=token.location,
+            items=(
+                ListItem(
+                    location=token.location, children=tuple(first_item_children), checked=None
+                ),
+            ),
+            ordered=ordered,
+            start=start,
+            tight=True,
+        )
 
     content_lines: list[str] = []
     current_token = token
@@ -211,24 +244,19 @@ def _parse_nested_list_from_indented_code_impl(
         if tok is None:
             break
 
-        if tok.type == TokenType.INDENTED_CODE:
+        if tok.type is TokenType.INDENTED_CODE:
             tok_original_indent = tok.line_indent
             tok_content = tok.value.lstrip()
 
-            # Check for sibling marker
-            is_sibling = _is_sibling_marker(
-                tok_content, tok_original_indent, original_indent, ordered, marker_char
-            )
-
-            if is_sibling:
+            # Check for sibling marker, splitting the marker once for both uses
+            if (
+                tok_original_indent == original_indent
+                and (tok_prefix := _split_marker(tok_content)) is not None
+                and _is_sibling_marker(tok_content, tok_prefix, ordered, marker_char)
+            ):
                 # Finalize current item
                 if content_lines:
-                    cl_content = "\n".join(content_lines)
-                    cl_inlines = parser._parse_inline(cl_content, tok.location)
-                    first_item_children.append(
-                        Paragraph(location=tok.location, children=cl_inlines)
-                    )
-                    content_lines = []
+                    parser._flush_item_paragraph(content_lines, tok, first_item_children)
 
                 items.append(
                     ListItem(
@@ -239,7 +267,7 @@ def _parse_nested_list_from_indented_code_impl(
                 )
 
                 # Start new item
-                new_remaining = _extract_remaining_content(tok_content, ordered)
+                new_remaining = tok_content[tok_prefix[2] + 1 :].strip()
                 first_item_children = []
                 if new_remaining:
                     new_inlines = parser._parse_inline(new_remaining, tok.location)
@@ -253,12 +281,7 @@ def _parse_nested_list_from_indented_code_impl(
             # Check for deeper nested list
             if tok_original_indent >= nested_content_indent and is_list_marker(tok_content):
                 if content_lines:
-                    cl_content = "\n".join(content_lines)
-                    cl_inlines = parser._parse_inline(cl_content, tok.location)
-                    first_item_children.append(
-                        Paragraph(location=tok.location, children=cl_inlines)
-                    )
-                    content_lines = []
+                    parser._flush_item_paragraph(content_lines, tok, first_item_children)
 
                 nested = parse_nested_list_from_indented_code(
                     tok, tok_original_indent, nested_content_indent, parser
@@ -274,11 +297,11 @@ def _parse_nested_list_from_indented_code_impl(
             else:
                 break
 
-        elif tok.type == TokenType.PARAGRAPH_LINE:
-            content_lines.append(tok.value.lstrip().rstrip())
+        elif tok.type is TokenType.PARAGRAPH_LINE:
+            content_lines.append(tok.value.strip())
             parser._advance()
 
-        elif tok.type == TokenType.BLANK_LINE:
+        elif tok.type is TokenType.BLANK_LINE:
             tight = False
             parser._advance()
 
@@ -287,9 +310,7 @@ def _parse_nested_list_from_indented_code_impl(
 
     # Finalize last item
     if content_lines:
-        cl_content = "\n".join(content_lines)
-        cl_inlines = parser._parse_inline(cl_content, current_token.location)
-        first_item_children.append(Paragraph(location=current_token.location, children=cl_inlines))
+        parser._flush_item_paragraph(content_lines, current_token, first_item_children)
 
     items.append(
         ListItem(
@@ -308,52 +329,35 @@ def _parse_nested_list_from_indented_code_impl(
     )
 
 
+def _split_marker(content: str) -> tuple[bool, str, int] | None:
+    """Split a leading list marker into ``(ordered, marker_char, marker_end)``.
+
+    marker_char is the bullet or the ordered delimiter and marker_end
+    indexes just past it. Returns None when content does not start with a
+    bullet or an ASCII digit run followed by ``.`` or ``)``.
+    """
+    first_char = content[:1]
+    ordered = _MARKER_ORDERED.get(first_char)
+    if ordered is None:
+        return None
+    if not ordered:
+        return (False, first_char, 1)
+    pos = len(content) - len(content.lstrip("0123456789"))
+    if pos and pos < len(content) and content[pos] in ".)":
+        return (True, content[pos], pos + 1)
+    return None
+
+
 def _is_sibling_marker(
     content: str,
-    content_indent: int,
-    expected_indent: int,
+    prefix: tuple[bool, str, int],
     ordered: bool,
     marker_char: str,
 ) -> bool:
-    """Check if content is a sibling list marker at the expected indent."""
-    if content_indent != expected_indent:
-        return False
-
-    if not content:
-        return False
-
-    first_char = content[0]
-
-    if not ordered:
-        return (
-            first_char in "-*+"
-            and first_char == marker_char
-            and len(content) > 1
-            and content[1] in " \t"
-        )
-
-    if first_char.isdigit():
-        pos = 0
-        while pos < len(content) and content[pos].isdigit():
-            pos += 1
-        return (
-            pos < len(content)
-            and content[pos] == marker_char
-            and pos + 1 < len(content)
-            and content[pos + 1] in " \t"
-        )
-
-    return False
-
-
-def _extract_remaining_content(content: str, ordered: bool) -> str:
-    """Extract content after the list marker."""
-    first_char = content[0]
-
-    if first_char in "-*+":
-        return content[2:].strip() if len(content) > 2 else ""
-
-    pos = 0
-    while pos < len(content) and content[pos].isdigit():
-        pos += 1
-    return content[pos + 2 :].strip() if pos + 2 < len(content) else ""
+    """Check if a split marker continues the list with the same type and delimiter."""
+    tok_ordered, tok_marker_char, marker_end = prefix
+    return (
+        tok_ordered == ordered
+        and tok_marker_char == marker_char
+        and content[marker_end : marker_end + 1] in (" ", "\t")
+    )
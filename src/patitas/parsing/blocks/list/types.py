@@ -4,16 +4,19 @@ Provides dataclasses and type aliases for list parsing state management.
 """
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from patitas.nodes import Block
 
 
-@dataclass
-class ListMarkerInfo:
+class ListMarkerInfo(NamedTuple):
     """Information extracted from a list marker.
 
+    Instances are cached per marker string by ``extract_marker_info`` and
+    shared between list items. A NamedTuple keeps them immutable and cheap
+    to construct, and lets hot loops unpack all fields at once.
+
     Attributes:
         ordered: Whether this is an ordered list (1. vs -)
         bullet_char: For unordered lists, the bullet character (-, *, +)
@@ -8,6 +8,10 @@ Simple block quote criteria (all must be true):
 3. Content is simple paragraphs (no lists, code blocks, headings, etc.)
 4. No blank lines within the quote (single paragraph)
 
+Validation and construction share a single pass over the tokens: lines are
+collected while the criteria are checked, and inline parsing only runs
+once the whole quote has qualified.
+
 Performance: ~3-5% improvement for block quote-heavy documents.
 """
 
@@ -20,164 +24,107 @@ if TYPE_CHECKING:
     pass
 
 
-def is_simple_block_quote(tokens: list, start_pos: int) -> bool:
-    """Check if the block quote starting at start_pos meets simple criteria.
+def try_parse_simple_block_quote(
+    tokens: list,
+    start_pos: int,
+    parse_inline_fn,
+) -> tuple[BlockQuote, int] | None:
+    """Parse the block quote at start_pos if it meets the simple criteria.
 
     Args:
         tokens: Full token list
         start_pos: Position of first BLOCK_QUOTE_MARKER token
+        parse_inline_fn: Function to parse inline content: (text, location) -> tuple[Inline, ...]
 
     Returns:
-        True if block quote qualifies for fast path
+        (BlockQuote node, new_position after quote), or None if the quote
+        needs the full parser. Nothing is parsed before the quote qualifies.
     """
     if start_pos >= len(tokens):
-        return False
+        return None
 
     first_token = tokens[start_pos]
-    if first_token.type != TokenType.BLOCK_QUOTE_MARKER:
-        return False
-
-    first_lineno = first_token.location.lineno
+    bq_marker = TokenType.BLOCK_QUOTE_MARKER
+    if first_token.type is not bq_marker:
+        return None
+
+    paragraph_line = TokenType.PARAGRAPH_LINE
+    blank_line = TokenType.BLANK_LINE
+    eof = TokenType.EOF
+    # Track paragraphs separately (marker-only lines start a new paragraph)
+    paragraphs: list[list[str]] = [[]]
     pos = start_pos + 1  # Skip the first marker
     tokens_len = len(tokens)
     saw_content = False
-    last_lineno = first_lineno
+    line_had_content = False  # Track if current line has content after marker
+    last_lineno = first_token.location.lineno
 
     while pos < tokens_len:
         token = tokens[pos]
+        token_type = token.type
         token_lineno = token.location.lineno
 
         # If we're on a new line
         if token_lineno != last_lineno:
             # New line must start with BLOCK_QUOTE_MARKER or we end
-            if token.type == TokenType.BLOCK_QUOTE_MARKER:
+            if token_type is bq_marker:
                 # Check for nested quote (>> pattern)
                 # Look ahead to see if next token on same line is also a marker
                 if pos + 1 < tokens_len:
                     next_tok = tokens[pos + 1]
-                    if (
-                        next_tok.type == TokenType.BLOCK_QUOTE_MARKER
-                        and next_tok.location.lineno == token_lineno
-                    ):
+                    if next_tok.type is bq_marker and next_tok.location.lineno == token_lineno:
                         # Nested block quote - not simple
-                        return False
-                last_lineno = token_lineno
-                pos += 1
-                continue
-            elif token.type in (TokenType.BLANK_LINE, TokenType.EOF):
-                # Blank line or EOF ends the quote - that's OK for simple quote
-                break
-            else:
-                # No > marker on new line = lazy continuation
-                # (unless it's a blank line ending the quote)
-                return False
-
-        # Check token type for complexity
-        if token.type == TokenType.PARAGRAPH_LINE:
-            content = token.value
-            # Check for 4+ leading spaces (potential indented code)
-            stripped = content.lstrip()
-            leading_spaces = len(content) - len(stripped)
-            if leading_spaces >= 4:
-                # Potential indented code - not simple
-                return False
-            # Check if content starts with < (potential HTML)
-            if stripped.startswith("<"):
-                # Potential HTML block - not simple
-                return False
-            saw_content = True
-            last_lineno = token_lineno
-            pos += 1
-        elif token.type == TokenType.BLOCK_QUOTE_MARKER:
-            # Another marker on same line = nested
-            return False
-        elif token.type == TokenType.BLANK_LINE:
-            # Blank line within quote = loose quote (not simple)
-            return False
-        elif token.type in (
-            TokenType.ATX_HEADING,
-            TokenType.FENCED_CODE_START,
-            TokenType.LIST_ITEM_MARKER,
-            TokenType.THEMATIC_BREAK,
-            TokenType.INDENTED_CODE,
-            TokenType.HTML_BLOCK,
-            TokenType.LINK_REFERENCE_DEF,
-        ):
-            # Complex block-level content
-            return False
-        else:
-            # Unknown token - be conservative
-            return False
-
-    # Must have at least some content
-    return saw_content
-
-
-def parse_simple_block_quote(
-    tokens: list,
-    start_pos: int,
-    parse_inline_fn,
-) -> tuple[BlockQuote, int]:
-    """Parse a simple block quote using the fast path.
-
-    Args:
-        tokens: Full token list
-        start_pos: Position of first BLOCK_QUOTE_MARKER token
-        parse_inline_fn: Function to parse inline content: (text, location) -> tuple[Inline, ...]
-
-    Returns:
-        (BlockQuote node, new_position after quote)
-    """
-    first_token = tokens[start_pos]
-    # Track paragraphs separately (blank lines create new paragraphs)
-    paragraphs: list[list[str]] = [[]]
-    pos = start_pos + 1  # Skip first marker
-    tokens_len = len(tokens)
-    first_lineno = first_token.location.lineno
-    last_lineno = first_lineno
-    line_had_content = False  # Track if current line has content after marker
-
-    while pos < tokens_len:
-        token = tokens[pos]
-        token_lineno = token.location.lineno
-
-        # If we're on a new line
-        if token_lineno != last_lineno:
-            if token.type == TokenType.BLOCK_QUOTE_MARKER:
-                # New line with > marker
+                        return None
                 # If previous line had no content (just >), it's a blank line in quote
                 if not line_had_content and paragraphs[-1]:
-                    # Start new paragraph
                     paragraphs.append([])
                 line_had_content = False
                 last_lineno = token_lineno
                 pos += 1
                 continue
-            else:
-                # Quote ends
+            if token_type is blank_line or token_type is eof:
+                # Blank line or EOF ends the quote - that's OK for simple quote
                 break
+            # No > marker on new line = lazy continuation
+            return None
+
+        # Anything but paragraph text on a quoted line (another marker,
+        # a blank line, or block-level content) is not simple
+        if token_type is not paragraph_line:
+            return None
+
+        content = token.value
+        # Check for 4+ leading spaces (potential indented code)
+        stripped = content.lstrip()
+        if len(content) - len(stripped) >= 4:
+            # Potential indented code - not simple
+            return None
+        # Check if content starts with < (potential HTML)
+        if stripped.startswith("<"):
+            # Potential HTML block - not simple
+            return None
+        paragraphs[-1].append(stripped)
+        saw_content = True
+        line_had_content = True
+        last_lineno = token_lineno
+        pos += 1
 
-        # Accumulate content
-        if token.type == TokenType.PARAGRAPH_LINE:
-            # Strip leading whitespace from content
-            paragraphs[-1].append(token.value.lstrip())
-            line_had_content = True
-            last_lineno = token_lineno
-            pos += 1
-        elif token.type == TokenType.BLOCK_QUOTE_MARKER:
-            # Additional marker on same line (shouldn't happen in simple path)
-            last_lineno = token_lineno
-            pos += 1
-        else:
-            # End of quote
-            break
-
-    # Build paragraph nodes
-    children: list[Paragraph] = []
-    for para_lines in paragraphs:
-        if para_lines:
-            content = "\n".join(para_lines)
-            inlines = parse_inline_fn(content, first_token.location)
-            children.append(Paragraph(location=first_token.location, children=inlines))
-
-    return BlockQuote(location=first_token.location, children=tuple(children)), pos
+    # Must have at least some content
+    if not saw_content:
+        return None
+
+    # Build paragraph nodes, passing (location, children) positionally:
+    # the dataclass __init__ binds positional arguments faster than keywords
+    location = first_token.location
+    if len(paragraphs) == 1:
+        # Common case: one paragraph, which saw_content guarantees is non-empty
+        children: tuple[Paragraph, ...] = (
+            Paragraph(location, parse_inline_fn("\n".join(paragraphs[0]), location)),
+        )
+    else:
+        children = tuple(
+            Paragraph(location, parse_inline_fn("\n".join(lines), location))
+            for lines in paragraphs
+            if lines
+        )
+    return BlockQuote(location, children), pos
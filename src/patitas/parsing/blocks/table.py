@@ -3,6 +3,7 @@
 Handles GFM (GitHub Flavored Markdown) table parsing.
 """
 
+import re
 from typing import TYPE_CHECKING, Literal
 
 from patitas.nodes import Inline, Table, TableCell, TableRow
@@ -10,6 +11,16 @@ from patitas.nodes import Inline, Table, TableCell, TableRow
 if TYPE_CHECKING:
     from patitas.location import SourceLocation
 
+# Delimiter row cell; the groups capture the left and right alignment colons
+_DELIMITER_CELL = re.compile(r"(:?)-+(:?)")
+
+_ALIGNMENTS: dict[tuple[str, str], Literal["left", "center", "right"] | None] = {
+    ("", ""): None,
+    (":", ""): "left",
+    ("", ":"): "right",
+    (":", ":"): "center",
+}
+
 
 class TableParsingMixin:
     """Mixin for GFM table parsing.
@@ -49,17 +60,22 @@ class TableParsingMixin:
         if alignments is None:
             return None
 
-        # Parse header row cells as inline content
+        # One bound method serves every cell of the table
+        parse_inline = self._parse_inline
+
+        # Parse header row cells as inline content. The delimiter row matched
+        # the header's column count and body rows are normalized to it below,
+        # so every row pairs 1:1 with alignments.
         header_row = TableRow(
             location=location,
             cells=tuple(
                 TableCell(
                     location=location,
-                    children=self._parse_inline(cell.strip(), location),
+                    children=parse_inline(cell.strip(), location),
                     is_header=True,
-                    align=alignments[i] if i < len(alignments) else None,
+                    align=align,
                 )
-                for i, cell in enumerate(header_cells)
+                for cell, align in zip(header_cells, alignments, strict=True)
             ),
             is_header=True,
         )
@@ -86,11 +102,11 @@ class TableParsingMixin:
                         cells=tuple(
                             TableCell(
                                 location=location,
-                                children=self._parse_inline(cell.strip(), location),
+                                children=parse_inline(cell.strip(), location),
                                 is_header=False,
-                                align=alignments[i] if i < len(alignments) else None,
+                                align=align,
                             )
-                            for i, cell in enumerate(row_cells)
+                            for cell, align in zip(row_cells, alignments, strict=True)
                         ),
                         is_header=False,
                     )
@@ -120,27 +136,20 @@ class TableParsingMixin:
         if line.endswith("|"):
             line = line[:-1]
 
-        # Split on unescaped pipes
-        cells: list[str] = []
-        current_cell: list[str] = []
-        i = 0
-        while i < len(line):
-            if line[i] == "\\" and i + 1 < len(line) and line[i + 1] == "|":
-                # Escaped pipe
-                current_cell.append("|")
-                i += 2
-            elif line[i] == "|":
-                cells.append("".join(current_cell))
-                current_cell = []
-                i += 1
-            else:
-                current_cell.append(line[i])
-                i += 1
+        if "\\|" not in line:
+            return line.split("|")
 
-        # Add last cell
-        cells.append("".join(current_cell))
+        # Split on unescaped pipes: a cell ending in a backslash was cut at
+        # an escaped pipe, so restore the pipe and rejoin the next piece
+        pieces = line.split("|")
+        cells = [pieces[0]]
+        for piece in pieces[1:]:
+            if cells[-1].endswith("\\"):
+                cells[-1] = cells[-1][:-1] + "|" + piece
+            else:
+                cells.append(piece)
 
-        return cells if cells else None
+        return cells
 
     def _parse_table_delimiter(
         self, line: str, expected_cols: int
@@ -173,30 +182,11 @@ class TableParsingMixin:
             if not part:
                 continue
 
-            # Check for valid delimiter pattern: at least one dash
-            has_left_colon = part.startswith(":")
-            has_right_colon = part.endswith(":")
-
-            # Remove colons to check dashes
-            inner = part
-            if has_left_colon:
-                inner = inner[1:]
-            if has_right_colon:
-                inner = inner[:-1]
-
-            # Must have at least one dash
-            if not inner or not all(c == "-" for c in inner):
+            # Valid delimiter cell: at least one dash, optional colon on each side
+            match = _DELIMITER_CELL.fullmatch(part)
+            if match is None:
                 return None
-
-            # Determine alignment
-            if has_left_colon and has_right_colon:
-                alignments.append("center")
-            elif has_left_colon:
-                alignments.append("left")
-            elif has_right_colon:
-                alignments.append("right")
-            else:
-                alignments.append(None)
+            alignments.append(_ALIGNMENTS[match.groups()])
 
         # Must have at least one column
         if not alignments:
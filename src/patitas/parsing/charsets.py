@@ -15,17 +15,20 @@ Usage:
 """
 
 import unicodedata
+from functools import lru_cache
 
 # CommonMark: ASCII punctuation characters
 # https://spec.commonmark.org/0.31.2/#ascii-punctuation-character
 ASCII_PUNCTUATION: frozenset[str] = frozenset("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~")
 
 
+@lru_cache(maxsize=1024)
 def is_unicode_punctuation(char: str) -> bool:
     """Check if character is Unicode punctuation (Pc, Pd, Pe, Pf, Pi, Po, Ps, or Sc, Sk, Sm, So).
 
     CommonMark uses Unicode punctuation categories for flanking rules.
-    This includes ASCII punctuation as a subset.
+    This includes ASCII punctuation as a subset. Cached because text draws
+    on a small alphabet, so the same characters are classified repeatedly.
 
     """
     if not char:
@@ -46,12 +49,14 @@ WHITESPACE: frozenset[str] = frozenset(" \t\n\r\f\v")
 WHITESPACE_OR_EMPTY: frozenset[str] = WHITESPACE | frozenset([""])
 
 
+@lru_cache(maxsize=1024)
 def is_unicode_whitespace(char: str) -> bool:
     """Check if character is Unicode whitespace.
 
     CommonMark uses Unicode whitespace for emphasis flanking rules.
     Includes ASCII whitespace and Unicode category Zs (space separator).
     Also treats empty string as whitespace (for boundary checks).
+    Cached like is_unicode_punctuation.
 
     """
     if not char:
@@ -18,6 +18,7 @@ Future: Could generate Cython code for even faster dispatch.
 """
 
 from collections.abc import Callable
+from operator import attrgetter
 from typing import TYPE_CHECKING, cast
 
 from patitas.tokens import TokenType
@@ -26,6 +27,9 @@ if TYPE_CHECKING:
     from patitas.nodes import Block
     from patitas.tokens import Token
 
+_token_type = attrgetter("type")
+_EOF_ONLY: frozenset[TokenType] = frozenset({TokenType.EOF})
+
 # Type alias for parser functions
 type ParserFn = Callable[["list[Token]", Callable], "tuple[Block, ...]"]
 type DispatchStats = dict[str, int | set[frozenset[TokenType]]]
@@ -38,10 +42,13 @@ class PatternDispatcher:
     Uses frozenset of token types as pattern signature.
     """
 
-    __slots__ = ("_dispatch_table", "_stats")
+    __slots__ = ("_dispatch_table", "_known_types", "_stats")
 
     def __init__(self) -> None:
         self._dispatch_table: dict[frozenset[TokenType], ParserFn] = {}
+        # Union of all registered patterns plus EOF: a document containing
+        # any other token type cannot match, so the scan stops at the first one
+        self._known_types: frozenset[TokenType] = _EOF_ONLY
         self._stats: DispatchStats = {
             "hits": 0,
             "misses": 0,
@@ -53,21 +60,37 @@ class PatternDispatcher:
         pattern: frozenset[TokenType],
         parser: ParserFn,
     ) -> None:
-        """Register a parser for a token pattern."""
+        """Register a parser for a token pattern.
+
+        Pattern parsers never see the link reference collection pass, so a
+        pattern containing LINK_REFERENCE_DEF is rejected; callers can use a
+        dispatched parser without scanning the tokens for definitions.
+        """
+        if TokenType.LINK_REFERENCE_DEF in pattern:
+            raise ValueError("Patterns containing LINK_REFERENCE_DEF cannot be dispatched")
         self._dispatch_table[pattern] = parser
+        self._known_types |= pattern
 
     def get_parser(self, tokens: list[Token]) -> ParserFn | None:
         """Get parser for token pattern, or None for fallback.
 
-        O(1) lookup after O(n) signature computation.
-        Signature computation is very cheap (just type checks).
+        O(1) lookup after O(n) signature computation. A C-level scan first
+        stops at the first token whose type appears in no registered
+        pattern; such documents cannot match, so they miss without building
+        a signature and are not recorded in ``patterns_seen``.
         """
-        # Compute pattern signature (exclude EOF)
-        pattern = frozenset(tok.type for tok in tokens if tok.type != TokenType.EOF)
+        if not tokens or not all(map(self._known_types.__contains__, map(_token_type, tokens))):
+            misses = cast("int", self._stats["misses"])
+            self._stats["misses"] = misses + 1
+            return None
 
-        # Track stats for optimization tuning
-        patterns_seen = cast("set[frozenset[TokenType]]", self._stats["patterns_seen"])
-        patterns_seen.add(pattern)
+        # Compute pattern signature (exclude EOF); map() keeps the scan in C
+        pattern = frozenset(map(_token_type, tokens)) - _EOF_ONLY
+
+        # Track distinct patterns for optimization tuning (stripped under -O)
+        if __debug__:
+            patterns_seen = cast("set[frozenset[TokenType]]", self._stats["patterns_seen"])
+            patterns_seen.add(pattern)
 
         parser = self._dispatch_table.get(pattern)
         if parser is not None:
@@ -80,7 +103,11 @@ class PatternDispatcher:
         return parser
 
     def get_stats(self) -> dict:
-        """Get dispatch statistics."""
+        """Get dispatch statistics.
+
+        ``patterns_seen`` is only collected when assertions are enabled; it
+        stays 0 under ``python -O``.
+        """
         hits = cast("int", self._stats["hits"])
         misses = cast("int", self._stats["misses"])
         patterns_seen = cast("set[frozenset[TokenType]]", self._stats["patterns_seen"])
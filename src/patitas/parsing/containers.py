@@ -38,7 +38,7 @@ class ContainerType(Enum):
     FENCED_CODE = auto()  # Fenced code block (leaf, no nesting)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, init=False)
 class ContainerFrame:
     """A frame on the container stack representing a parsing context.
 
@@ -58,6 +58,10 @@ class ContainerFrame:
         bullet_char: For unordered lists, the bullet character
         start_number: For ordered lists, the starting number
 
+    The dataclass supplies ``__eq__``/``__repr__``; ``__init__`` is written
+    by hand so the max_sibling_indent default is resolved without a
+    separate ``__post_init__`` call on every frame.
+
     """
 
     container_type: ContainerType
@@ -68,7 +72,7 @@ class ContainerFrame:
     marker_width: int = 0  # Width of the marker (e.g., 2 for "- ")
 
     # For lists: marker siblings can appear at start_indent to start_indent+3
-    max_sibling_indent: int = field(default=-1)
+    max_sibling_indent: int = -1
 
     # State that propagates upward on pop
     is_loose: bool = False
@@ -79,10 +83,59 @@ class ContainerFrame:
     bullet_char: str = ""
     start_number: int = 1
 
-    def __post_init__(self) -> None:
-        """Set default max_sibling_indent if not provided."""
-        if self.max_sibling_indent == -1:
-            self.max_sibling_indent = self.start_indent
+    def __init__(
+        self,
+        container_type: ContainerType,
+        start_indent: int,
+        content_indent: int,
+        marker_width: int = 0,
+        max_sibling_indent: int = -1,
+        is_loose: bool = False,
+        saw_blank_line: bool = False,
+        ordered: bool = False,
+        bullet_char: str = "",
+        start_number: int = 1,
+    ) -> None:
+        self.container_type = container_type
+        self.start_indent = start_indent
+        self.content_indent = content_indent
+        self.marker_width = marker_width
+        # -1 means "not provided": siblings default to the marker's own indent
+        self.max_sibling_indent = start_indent if max_sibling_indent == -1 else max_sibling_indent
+        self.is_loose = is_loose
+        self.saw_blank_line = saw_blank_line
+        self.ordered = ordered
+        self.bullet_char = bullet_char
+        self.start_number = start_number
+
+    @classmethod
+    def new_list(
+        cls,
+        start_indent: int,
+        content_indent: int,
+        marker_width: int,
+        ordered: bool,
+        bullet_char: str,
+        start_number: int,
+    ) -> ContainerFrame:
+        """Create a LIST frame (positional construction for the list hot path)."""
+        return cls(
+            ContainerType.LIST,
+            start_indent,
+            content_indent,
+            marker_width,
+            start_indent,
+            False,
+            False,
+            ordered,
+            bullet_char,
+            start_number,
+        )
+
+    @classmethod
+    def new_list_item(cls, start_indent: int, content_indent: int) -> ContainerFrame:
+        """Create a LIST_ITEM frame (positional construction for the list hot path)."""
+        return cls(ContainerType.LIST_ITEM, start_indent, content_indent, 0, start_indent)
 
     def owns_content(self, indent: int) -> bool:
         """Does this container own content at this indent level?
@@ -106,7 +159,7 @@ class ContainerFrame:
         Returns:
             True if a marker at this indent is a sibling item
         """
-        if self.container_type != ContainerType.LIST:
+        if self.container_type is not ContainerType.LIST:
             return False
         return self.start_indent <= indent <= self.max_sibling_indent
 
@@ -127,6 +180,11 @@ class ContainerStack:
     """Manages the stack of active containers during parsing.
 
     Invariant: stack[0] is always DOCUMENT, stack[-1] is innermost container.
+    ``_bq_depth`` counts BLOCK_QUOTE frames on the stack so "inside a block
+    quote?" is an int compare instead of a stack scan, and ``_top`` caches
+    stack[-1] for the current()/mark_*() calls made on every blank line.
+    List items, the most frequent frames, are recycled through
+    push_list_item()/pop_list_item() instead of being built per item.
 
     Usage:
         stack = ContainerStack()  # Initializes with DOCUMENT frame
@@ -137,16 +195,34 @@ class ContainerStack:
     """
 
     _stack: list[ContainerFrame] = field(default_factory=list)
+    _bq_depth: int = 0
+    _top: ContainerFrame = field(init=False, repr=False, compare=False)
+    # LIST_ITEM frames released by pop_list_item(), reused by push_list_item()
+    _free_items: list[ContainerFrame] = field(default_factory=list, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize with DOCUMENT frame."""
-        self._stack = [
-            ContainerFrame(
-                container_type=ContainerType.DOCUMENT,
-                start_indent=0,
-                content_indent=0,
-            )
-        ]
+        self._top = ContainerFrame(
+            container_type=ContainerType.DOCUMENT,
+            start_indent=0,
+            content_indent=0,
+        )
+        self._stack = [self._top]
+        self._bq_depth = 0
+
+    def reset(self) -> None:
+        """Return to the freshly constructed state for a new parse.
+
+        Truncates the stack to its DOCUMENT frame and reinitializes that
+        frame in place; recycled list item frames are kept. Used by
+        Parser._reinit() so pooled parsers keep their stack.
+        """
+        stack = self._stack
+        del stack[1:]
+        document = self._top = stack[0]
+        # Re-run the initializer so every field returns to its default
+        ContainerFrame.__init__(document, ContainerType.DOCUMENT, 0, 0)
+        self._bq_depth = 0
 
     def push(self, frame: ContainerFrame) -> None:
         """Push a new container onto the stack.
@@ -159,6 +235,9 @@ class ContainerStack:
         """
         assert len(self._stack) > 0, "Cannot push to empty stack"
         self._stack.append(frame)
+        self._top = frame
+        if frame.container_type is ContainerType.BLOCK_QUOTE:
+            self._bq_depth += 1
 
     def pop(self) -> ContainerFrame:
         """Pop the innermost container.
@@ -182,31 +261,69 @@ class ContainerStack:
         if len(self._stack) <= 1:
             raise ValueError("Cannot pop document frame")
 
-        frame = self._stack.pop()
-
-        # Propagate looseness to parent container
-        if frame.saw_blank_line or frame.is_loose:
-            parent = self._stack[-1]
-            # LIST_ITEM -> propagate to parent LIST
-            # This handles blank lines within item content
-            if (
-                frame.container_type == ContainerType.LIST_ITEM
-                and parent.container_type == ContainerType.LIST
-            ):
-                parent.is_loose = True
-                parent.saw_blank_line = True
-            # Note: We do NOT propagate nested LIST -> parent LIST_ITEM
-            # because nested list looseness should not affect outer list
+        stack = self._stack
+        frame = stack.pop()
+        parent = self._top = stack[-1]
+        container_type = frame.container_type
+        if container_type is ContainerType.BLOCK_QUOTE:
+            self._bq_depth -= 1
+        elif not (frame.saw_blank_line or frame.is_loose):
+            # Common case: a tight frame has nothing to propagate
+            return frame
+
+        # Propagate looseness to parent container:
+        # LIST_ITEM -> propagate to parent LIST
+        # This handles blank lines within item content
+        # Note: We do NOT propagate nested LIST -> parent LIST_ITEM
+        # because nested list looseness should not affect outer list
+        if (
+            container_type is ContainerType.LIST_ITEM
+            and parent.container_type is ContainerType.LIST
+            and (frame.saw_blank_line or frame.is_loose)
+        ):
+            parent.is_loose = True
+            parent.saw_blank_line = True
+
+        return frame
+
+    def push_list_item(self, start_indent: int, content_indent: int) -> ContainerFrame:
+        """Push a LIST_ITEM frame, reusing one released by pop_list_item().
 
+        Args:
+            start_indent: Where the item's marker starts
+            content_indent: Minimum indent for the item's content
+
+        Returns:
+            The pushed frame, reset as if built by ContainerFrame.new_list_item()
+        """
+        if not self._free_items:
+            frame = ContainerFrame.new_list_item(start_indent, content_indent)
+        else:
+            frame = self._free_items.pop()
+            frame.start_indent = start_indent
+            frame.content_indent = content_indent
+            frame.max_sibling_indent = start_indent
+            frame.is_loose = False
+            frame.saw_blank_line = False
+        self._stack.append(frame)
+        self._top = frame
         return frame
 
+    def pop_list_item(self) -> None:
+        """Pop a frame pushed by push_list_item() and keep it for reuse.
+
+        Propagates looseness like pop(). The frame must not be used by the
+        caller afterwards; the next push_list_item() may hand it out again.
+        """
+        self._free_items.append(self.pop())
+
     def current(self) -> ContainerFrame:
         """Get the innermost container.
 
         Returns:
             The current (innermost) container frame
         """
-        return self._stack[-1]
+        return self._top
 
     def depth(self) -> int:
         """Current nesting depth (document = 0).
@@ -245,7 +362,7 @@ class ContainerStack:
         """
         for i in range(len(self._stack) - 1, -1, -1):
             frame = self._stack[i]
-            if frame.container_type == ContainerType.LIST and frame.owns_marker(marker_indent):
+            if frame.container_type is ContainerType.LIST and frame.owns_marker(marker_indent):
                 return (frame, i)
         return None
 
@@ -265,12 +382,13 @@ class ContainerStack:
 
     def mark_loose(self) -> None:
         """Mark current container as loose (saw blank line with content after)."""
-        self._stack[-1].is_loose = True
-        self._stack[-1].saw_blank_line = True
+        top = self._top
+        top.is_loose = True
+        top.saw_blank_line = True
 
     def mark_blank_line(self) -> None:
         """Mark that a blank line was seen in current container."""
-        self._stack[-1].saw_blank_line = True
+        self._top.saw_blank_line = True
 
     def mark_parent_list_loose(self) -> None:
         """Mark the parent LIST container as loose.
@@ -280,7 +398,7 @@ class ContainerStack:
         """
         if len(self._stack) >= 2:
             parent = self._stack[-2]
-            if parent.container_type == ContainerType.LIST:
+            if parent.container_type is ContainerType.LIST:
                 parent.is_loose = True
                 parent.saw_blank_line = True
 
@@ -294,4 +412,4 @@ class ContainerStack:
         Args:
             actual_content_indent: The actual content indent from first line
         """
-        self._stack[-1].content_indent = actual_content_indent
+        self._top.content_indent = actual_content_indent
@@ -81,8 +81,11 @@ class TokenNavHost(Protocol):
 
     def _at_end(self) -> bool: ...
     def _advance(self) -> Token | None: ...
+    def _skip_blank_lines(self) -> None: ...
     def _peek(self, offset: int = 1) -> Token | None: ...
+    def _line_index(self) -> list[int]: ...
     def _line_start_for_offset(self, offset: int) -> int: ...
+    def _line_bounds(self, offset: int) -> tuple[int, int]: ...
     def _get_line_at(self, offset: int) -> str: ...
     def _strip_columns(self, text: str, count: int) -> str: ...
 
@@ -273,7 +276,15 @@ class ParserHost(InlineParsingHost, BlockParsingHost, Protocol):
         ordered_marker_char: str,
         marker_stripped: str,
     ) -> ListItem: ...
-    def _calculate_actual_content_indent(self, tok: Token, marker_stripped: str) -> int: ...
+    def _reclassify_block_quote_code(
+        self, children: list[Block], content_indent: int
+    ) -> list[Block]: ...
+    def _flush_item_paragraph(
+        self, content_lines: list[str], marker_token: Token, item_children: list[Block]
+    ) -> None: ...
+    def _calculate_actual_content_indent(
+        self, tok: Token, marker_stripped: str, original_line: str | None = None
+    ) -> int: ...
     def _handle_indented_code_in_item(
         self,
         tok: Token,
@@ -41,6 +41,21 @@ class TokenNavigationMixin:
             self._current = None
         return self._current
 
+    def _skip_blank_lines(self) -> None:
+        """Advance past a run of BLANK_LINE tokens with one index scan.
+
+        Equivalent to calling ``_advance()`` while the current token is a
+        blank line, but touches ``_pos``/``_current`` only once per run.
+        """
+        tokens = self._tokens
+        end = self._tokens_len
+        pos = self._pos
+        while pos < end and tokens[pos].type is TokenType.BLANK_LINE:
+            pos += 1
+        if pos != self._pos:
+            self._pos = pos
+            self._current = tokens[pos] if pos < end else None
+
     def _peek(self, offset: int = 1) -> Token | None:
         """Peek at token at offset from current position."""
         pos = self._pos + offset
@@ -48,23 +63,43 @@ class TokenNavigationMixin:
             return self._tokens[pos]
         return None
 
-    def _line_start_for_offset(self, offset: int) -> int:
-        """Get start offset of line containing offset. O(log n) with lazy line index."""
-        if self._line_starts is None:
+    def _line_index(self) -> list[int]:
+        """Get the line start offsets, building the index on first use."""
+        line_starts = self._line_starts
+        if line_starts is None:
+            # str.find jumps newline to newline in C instead of a per-char loop
+            source = self._source
+            find = source.find
             line_starts = [0]
-            for i, c in enumerate(self._source):
-                if c == "\n":
-                    line_starts.append(i + 1)
+            append = line_starts.append
+            pos = find("\n")
+            while pos != -1:
+                pos += 1
+                append(pos)
+                pos = find("\n", pos)
             self._line_starts = line_starts
-        idx = bisect.bisect_right(self._line_starts, offset) - 1
-        return self._line_starts[idx] if idx >= 0 else 0
+        return line_starts
+
+    def _line_start_for_offset(self, offset: int) -> int:
+        """Get start offset of line containing offset. O(log n) with lazy line index."""
+        line_starts = self._line_index()
+        idx = bisect.bisect_right(line_starts, offset) - 1
+        return line_starts[idx] if idx >= 0 else 0
+
+    def _line_bounds(self, offset: int) -> tuple[int, int]:
+        """Get (start, end) of the line containing offset, end excluding the newline.
+
+        O(log n) with the lazy line index; no ``str.find`` scan for the line end.
+        """
+        line_starts = self._line_index()
+        idx = bisect.bisect_right(line_starts, offset) - 1
+        if idx + 1 < len(line_starts):
+            return line_starts[idx], line_starts[idx + 1] - 1
+        return line_starts[idx], len(self._source)
 
     def _get_line_at(self, offset: int) -> str:
         """Get the full line content containing the given source offset."""
-        start = self._line_start_for_offset(offset)
-        end = self._source.find("\n", offset)
-        if end == -1:
-            end = len(self._source)
+        start, end = self._line_bounds(offset)
         return self._source[start:end]
 
     def _strip_columns(self, text: str, count: int) -> str:
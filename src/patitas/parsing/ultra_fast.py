@@ -80,14 +80,18 @@ def can_use_ultra_fast(tokens: list[Token], *, tables_enabled: bool = False) ->
     Returns:
         True if only simple PARAGRAPH_LINE, BLANK_LINE, EOF tokens present
     """
+    paragraph_line = TokenType.PARAGRAPH_LINE
     for tok in tokens:
-        if tok.type == TokenType.PARAGRAPH_LINE:
+        tok_type = tok.type
+        if tok_type is paragraph_line:
             content = tok.value.strip()
             if not content:
                 continue
 
-            # Check for setext heading underlines (=== or ---)
-            if all(c == "=" for c in content) or all(c == "-" for c in content):
+            # Check for setext heading underlines (=== or ---): one C-level
+            # strip of the underline character instead of a generator scan
+            first = content[0]
+            if (first == "=" or first == "-") and not content.strip(first):
                 # Potential setext underline - not ultra-simple
                 return False
 
@@ -100,6 +104,6 @@ def can_use_ultra_fast(tokens: list[Token], *, tables_enabled: bool = False) ->
                 # Potential table - not ultra-simple
                 return False
 
-        elif tok.type not in (TokenType.BLANK_LINE, TokenType.EOF):
+        elif tok_type is not TokenType.BLANK_LINE and tok_type is not TokenType.EOF:
             return False
     return True
@@ -0,0 +1,36 @@
+"""Tests for character classification helpers."""
+
+import pytest
+
+from patitas.parsing.charsets import is_unicode_punctuation, is_unicode_whitespace
+
+
+class TestIsUnicodePunctuation:
+    """Tests for is_unicode_punctuation."""
+
+    @pytest.mark.parametrize("char", ["*", "_", "\u2014", "\u201c", "\u00a3", "+"])
+    def test_punctuation_and_symbols(self, char: str) -> None:
+        assert is_unicode_punctuation(char)
+
+    @pytest.mark.parametrize("char", ["", "a", "\u00e9", " ", "7"])
+    def test_other(self, char: str) -> None:
+        assert not is_unicode_punctuation(char)
+
+
+class TestIsUnicodeWhitespace:
+    """Tests for is_unicode_whitespace."""
+
+    @pytest.mark.parametrize("char", ["", " ", "\t", "\n", "\u00a0", "\u3000"])
+    def test_whitespace(self, char: str) -> None:
+        assert is_unicode_whitespace(char)
+
+    @pytest.mark.parametrize("char", ["a", "*", "\u200b"])
+    def test_other(self, char: str) -> None:
+        assert not is_unicode_whitespace(char)
+
+    def test_repeated_characters_hit_the_cache(self) -> None:
+        is_unicode_whitespace.cache_clear()
+        for _ in range(3):
+            assert not is_unicode_whitespace("x")
+        info = is_unicode_whitespace.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
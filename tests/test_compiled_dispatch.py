@@ -0,0 +1,49 @@
+"""Tests for the compiled pattern dispatcher."""
+
+import pytest
+
+from patitas.lexer import Lexer
+from patitas.parsing.compiled_dispatch import build_dispatcher
+from patitas.parsing.pattern_parsers import parse_atx_only
+from patitas.tokens import TokenType
+
+
+class TestPatternDispatcher:
+    """Tests for PatternDispatcher.get_parser."""
+
+    def test_matching_pattern(self) -> None:
+        dispatcher = build_dispatcher()
+        tokens = list(Lexer("# a\n## b\n").tokenize())
+        assert dispatcher.get_parser(tokens) is parse_atx_only
+
+    def test_unknown_first_token_misses_without_signature(self) -> None:
+        dispatcher = build_dispatcher()
+        tokens = list(Lexer("- a\n- b\n").tokenize())
+        assert dispatcher.get_parser(tokens) is None
+        stats = dispatcher.get_stats()
+        assert stats["misses"] == 1
+        assert stats["patterns_seen"] == 0
+
+    def test_unknown_type_after_known_first_token(self) -> None:
+        dispatcher = build_dispatcher()
+        tokens = list(Lexer("# a\n\n- b\n").tokenize())
+        assert dispatcher.get_parser(tokens) is None
+        assert dispatcher.get_stats()["patterns_seen"] == 0
+
+    def test_known_types_without_a_matching_pattern(self) -> None:
+        dispatcher = build_dispatcher()
+        tokens = list(Lexer("# a\n<div>\n").tokenize())
+        assert dispatcher.get_parser(tokens) is None
+        stats = dispatcher.get_stats()
+        assert stats["misses"] == 1
+        assert stats["patterns_seen"] == 1
+
+    def test_empty_tokens(self) -> None:
+        assert build_dispatcher().get_parser([]) is None
+
+    def test_link_reference_patterns_are_rejected(self) -> None:
+        dispatcher = build_dispatcher()
+        with pytest.raises(ValueError, match="LINK_REFERENCE_DEF"):
+            dispatcher.register(
+                frozenset({TokenType.ATX_HEADING, TokenType.LINK_REFERENCE_DEF}), parse_atx_only
+            )
@@ -0,0 +1,177 @@
+"""Tests for the parser's ContainerStack bookkeeping."""
+
+import pytest
+
+from patitas.parsing.containers import ContainerFrame, ContainerStack, ContainerType
+
+
+def _frame(container_type: ContainerType) -> ContainerFrame:
+    return ContainerFrame(container_type=container_type, start_indent=0, content_indent=2)
+
+
+class TestBlockQuoteDepth:
+    """_bq_depth tracks BLOCK_QUOTE frames across push/pop."""
+
+    def test_starts_at_zero(self) -> None:
+        assert ContainerStack()._bq_depth == 0
+
+    def test_push_and_pop(self) -> None:
+        stack = ContainerStack()
+        stack.push(_frame(ContainerType.BLOCK_QUOTE))
+        stack.push(_frame(ContainerType.LIST))
+        stack.push(_frame(ContainerType.BLOCK_QUOTE))
+        assert stack._bq_depth == 2
+        stack.pop()
+        assert stack._bq_depth == 1
+        stack.pop()
+        assert stack._bq_depth == 1
+        stack.pop()
+        assert stack._bq_depth == 0
+
+    def test_pop_until(self) -> None:
+        stack = ContainerStack()
+        stack.push(_frame(ContainerType.BLOCK_QUOTE))
+        stack.push(_frame(ContainerType.BLOCK_QUOTE))
+        stack.pop_until(0)
+        assert stack._bq_depth == 0
+
+
+class TestCurrentFrame:
+    """current() and the mark_* helpers track the innermost frame."""
+
+    def test_current_follows_push_and_pop(self) -> None:
+        stack = ContainerStack()
+        document = stack.current()
+        assert document.container_type is ContainerType.DOCUMENT
+        outer = _frame(ContainerType.LIST)
+        inner = _frame(ContainerType.LIST_ITEM)
+        stack.push(outer)
+        stack.push(inner)
+        assert stack.current() is inner
+        stack.pop()
+        assert stack.current() is outer
+        stack.pop_until(0)
+        assert stack.current() is document
+
+    def test_mark_loose_and_propagation(self) -> None:
+        stack = ContainerStack()
+        lst = _frame(ContainerType.LIST)
+        stack.push(lst)
+        stack.push(_frame(ContainerType.LIST_ITEM))
+        stack.mark_loose()
+        assert not lst.is_loose
+        stack.pop()
+        assert lst.is_loose
+        stack.update_content_indent(5)
+        assert lst.content_indent == 5
+
+    def test_pop_propagates_only_from_loose_items(self) -> None:
+        stack = ContainerStack()
+        item = _frame(ContainerType.LIST_ITEM)
+        stack.push(item)
+        nested = _frame(ContainerType.LIST)
+        stack.push(nested)
+        stack.mark_loose()
+        stack.pop()
+        assert not item.is_loose
+        lst = _frame(ContainerType.LIST)
+        stack.push(lst)
+        stack.push(_frame(ContainerType.LIST_ITEM))
+        stack.pop()
+        assert not lst.is_loose
+
+
+class TestFrameFactories:
+    """The positional factories match keyword construction."""
+
+    def test_new_list(self) -> None:
+        frame = ContainerFrame.new_list(2, 5, 2, True, "", 3)
+        assert frame == ContainerFrame(
+            container_type=ContainerType.LIST,
+            start_indent=2,
+            content_indent=5,
+            marker_width=2,
+            ordered=True,
+            bullet_char="",
+            start_number=3,
+        )
+
+    def test_new_list_item(self) -> None:
+        frame = ContainerFrame.new_list_item(4, 6)
+        assert frame == ContainerFrame(
+            container_type=ContainerType.LIST_ITEM, start_indent=4, content_indent=6
+        )
+        assert frame.max_sibling_indent == 4
+
+
+class TestIndentQueries:
+    """find_owner() and find_sibling_list() agree with the frame predicates."""
+
+    def _stack(self) -> tuple[ContainerStack, ContainerFrame, ContainerFrame]:
+        stack = ContainerStack()
+        lst = ContainerFrame.new_list(0, 2, 1, False, "-", 1)
+        stack.push(lst)
+        item = stack.push_list_item(0, 2)
+        return stack, lst, item
+
+    @pytest.mark.parametrize("indent", range(6))
+    def test_find_owner(self, indent: int) -> None:
+        stack, _, _ = self._stack()
+        frame, index = stack.find_owner(indent)
+        assert frame.owns_content(indent)
+        assert stack._stack[index] is frame
+        assert not any(f.owns_content(indent) for f in stack._stack[index + 1 :])
+
+    @pytest.mark.parametrize("indent", range(4))
+    def test_find_sibling_list(self, indent: int) -> None:
+        stack, lst, _ = self._stack()
+        expected = (lst, 1) if lst.owns_marker(indent) else None
+        assert stack.find_sibling_list(indent) == expected
+
+
+class TestListItemRecycling:
+    """push_list_item()/pop_list_item() reuse released LIST_ITEM frames."""
+
+    def test_recycled_frame_is_reset(self) -> None:
+        stack = ContainerStack()
+        lst = _frame(ContainerType.LIST)
+        stack.push(lst)
+        first = stack.push_list_item(0, 2)
+        stack.mark_loose()
+        stack.update_content_indent(7)
+        stack.pop_list_item()
+        assert lst.is_loose
+        assert stack.current() is lst
+
+        second = stack.push_list_item(3, 5)
+        assert second is first
+        assert second == ContainerFrame.new_list_item(3, 5)
+        assert stack.current() is second
+
+    def test_nested_items_use_distinct_frames(self) -> None:
+        stack = ContainerStack()
+        outer = stack.push_list_item(0, 2)
+        inner = stack.push_list_item(2, 4)
+        assert inner is not outer
+        stack.pop_list_item()
+        stack.pop_list_item()
+        assert stack.depth() == 0
+
+
+class TestReset:
+    """reset() returns a used stack to its initial state."""
+
+    def test_reset_after_nesting(self) -> None:
+        stack = ContainerStack()
+        document = stack.current()
+        document.is_loose = True
+        stack.push(_frame(ContainerType.BLOCK_QUOTE))
+        stack.push(_frame(ContainerType.LIST))
+        stack.push_list_item(0, 2)
+        stack.pop_list_item()
+        stack.reset()
+        assert stack.current() is document
+        assert stack.depth() == 0
+        assert stack._bq_depth == 0
+        assert document == ContainerStack().current()
+        assert len(stack._free_items) == 1
@@ -75,6 +75,15 @@ class TestExtractExcerpt:
         assert "First item" in result
         assert "Second item" in result
 
+    def test_code_blocks_contribute_first_line_only(self) -> None:
+        """Fenced and indented code add just their first line."""
+        source = "# Title\n\n```py\nfirst = 1\nsecond = 2\n```\n\n    alpha\n    beta\n"
+        result = extract_excerpt(parse(source), source)
+        assert "first = 1" in result
+        assert "alpha" in result
+        assert "second" not in result
+        assert "beta" not in result
+
 
 class TestExtractMetaDescription:
     """Tests for extract_meta_description."""
@@ -0,0 +1,254 @@
+"""Tests for list marker helpers used by the list parser."""
+
+import pytest
+
+from patitas import Markdown
+from patitas.parsing.blocks.list.indent import count_whitespace_columns
+from patitas.parsing.blocks.list.marker import (
+    CONTENT_BLOCK_QUOTE,
+    CONTENT_FENCE,
+    CONTENT_LIST_MARKER,
+    build_same_list_matcher,
+    classify_indented_content,
+    extract_marker_info,
+    extract_task_marker,
+    get_marker_indent,
+    get_marker_width,
+    is_list_marker,
+    is_same_list_type,
+)
+from patitas.parsing.blocks.list.nested import detect_nested_block_in_content
+
+
+class TestExtractMarkerInfo:
+    """Tests for extract_marker_info."""
+
+    def test_unordered_marker(self) -> None:
+        info = extract_marker_info("  - ")
+        assert info.ordered is False
+        assert info.bullet_char == "-"
+        assert info.ordered_marker_char == ""
+        assert info.indent == 2
+        assert info.marker_length == 2
+
+    def test_ordered_marker(self) -> None:
+        info = extract_marker_info("123) ")
+        assert info.ordered is True
+        assert info.ordered_marker_char == ")"
+        assert info.start == 123
+        assert info.indent == 0
+        assert info.marker_length == 5
+
+    def test_trailing_spaces_extend_marker_length(self) -> None:
+        assert extract_marker_info("1.   ").marker_length == 5
+        assert extract_marker_info("*  ").marker_length == 3
+
+    def test_bare_marker(self) -> None:
+        assert extract_marker_info("-").marker_length == 1
+        info = extract_marker_info("7.")
+        assert info.start == 7
+        assert info.marker_length == 2
+
+    def test_tab_indent(self) -> None:
+        assert extract_marker_info(" \t- ").indent == 4
+
+    def test_start_indent_override(self) -> None:
+        assert extract_marker_info("  - ", 6).indent == 6
+
+    def test_cached_info_is_shared_and_frozen(self) -> None:
+        info = extract_marker_info("- ")
+        assert extract_marker_info("- ") is info
+        with pytest.raises(AttributeError):
+            info.indent = 3  # type: ignore[misc]
+
+
+class TestExtractTaskMarker:
+    """Tests for extract_task_marker."""
+
+    def test_unchecked(self) -> None:
+        assert extract_task_marker("[ ] todo") == (False, "todo")
+
+    def test_checked(self) -> None:
+        assert extract_task_marker("[x] done") == (True, "done")
+        assert extract_task_marker("[X] done") == (True, "done")
+
+    def test_not_a_task(self) -> None:
+        assert extract_task_marker("[y] text") == (None, "[y] text")
+        assert extract_task_marker("[ ]") == (None, "[ ]")
+        assert extract_task_marker("") == (None, "")
+
+
+class TestIsSameListType:
+    """Tests for is_same_list_type."""
+
+    def test_same_bullet(self) -> None:
+        assert is_same_list_type("  - ", False, "-", "")
+        assert not is_same_list_type("* ", False, "-", "")
+
+    def test_same_ordered_delimiter(self) -> None:
+        assert is_same_list_type("10. ", True, "", ".")
+        assert not is_same_list_type("10) ", True, "", ".")
+
+    def test_ordered_vs_unordered(self) -> None:
+        assert not is_same_list_type("1. ", False, "-", "")
+        assert not is_same_list_type("- ", True, "", ".")
+
+    def test_empty_marker(self) -> None:
+        assert not is_same_list_type("   ", False, "-", "")
+
+
+class TestBuildSameListMatcher:
+    """build_same_list_matcher agrees with is_same_list_type."""
+
+    @pytest.mark.parametrize(
+        ("ordered", "bullet_char", "ordered_marker_char"),
+        [(False, "-", ""), (False, "*", ""), (False, "+", ""), (True, "", "."), (True, "", ")")],
+    )
+    @pytest.mark.parametrize(
+        "marker", ["- ", "  * ", "\t+ ", "1. ", "   42) ", "-", "9.", "", "  "]
+    )
+    def test_matches_is_same_list_type(
+        self, ordered: bool, bullet_char: str, ordered_marker_char: str, marker: str
+    ) -> None:
+        match = build_same_list_matcher(ordered, bullet_char, ordered_marker_char)
+        expected = is_same_list_type(marker, ordered, bullet_char, ordered_marker_char)
+        assert (match(marker) is not None) == expected
+
+
+class TestAsciiDigitsOnly:
+    """CommonMark ordered markers use ASCII digits 0-9 only."""
+
+    def test_non_ascii_digits_are_not_list_markers(self) -> None:
+        assert not is_list_marker("\u0661. foo")
+        assert not is_list_marker("²) foo")
+        assert is_list_marker("12. foo")
+
+    @pytest.mark.parametrize("source", ["\u0661. foo\n", "²) foo\n", "- a\n\n  ³. b\n"])
+    def test_non_ascii_digit_lines_render_as_text(self, source: str) -> None:
+        html = Markdown()(source)
+        assert "<ol>" not in html
+        assert source.split()[-1] in html
+
+
+class TestGetMarkerIndent:
+    """Tests for get_marker_indent."""
+
+    def test_spaces(self) -> None:
+        assert get_marker_indent("-") == 0
+        assert get_marker_indent("   1.") == 3
+        assert get_marker_indent("    ") == 4
+
+    def test_tabs_expand_to_next_stop(self) -> None:
+        assert get_marker_indent("\t-") == 4
+        assert get_marker_indent("  \t-") == 4
+        assert get_marker_indent("\t  -") == 6
+        assert get_marker_indent(" \t \t-") == 8
+
+    def test_repeated_markers_hit_the_cache(self) -> None:
+        get_marker_indent.cache_clear()
+        for _ in range(3):
+            assert get_marker_indent("  \t- ") == 4
+        info = get_marker_indent.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+
+class TestIsListMarker:
+    """Tests for is_list_marker."""
+
+    @pytest.mark.parametrize("text", ["-", "* x", "+\tx", "1.", "12) x", "3.\tx"])
+    def test_markers(self, text: str) -> None:
+        assert is_list_marker(text)
+
+    @pytest.mark.parametrize("text", ["", "-x", "-\n", "1", "1.x", "1:", "a. x", "> x", "#"])
+    def test_non_markers(self, text: str) -> None:
+        assert not is_list_marker(text)
+
+
+class TestEmptyMarkerValue:
+    """Whitespace-only marker values fall back to a bare bullet."""
+
+    def test_empty_marker_value(self) -> None:
+        info = extract_marker_info("  ")
+        assert (info.ordered, info.bullet_char, info.indent, info.marker_length) == (
+            False,
+            "-",
+            2,
+            1,
+        )
+
+
+class TestCountWhitespaceColumns:
+    """Tests for count_whitespace_columns."""
+
+    def test_spaces(self) -> None:
+        assert count_whitespace_columns("   x") == 3
+        assert count_whitespace_columns("x") == 0
+        assert count_whitespace_columns("  ") == 2
+
+    def test_tabs_expand_from_start_column(self) -> None:
+        assert count_whitespace_columns("\tx") == 4
+        assert count_whitespace_columns("\tx", 1) == 3
+        assert count_whitespace_columns(" \t x", 2) == 3
+
+    @pytest.mark.parametrize(
+        ("source", "code"),
+        [
+            ("-      code\n", " code"),
+            ("1.      code\n", " code"),
+            ("-\t\tcode\n", "  code"),
+            ("- \t   code\n", " code"),
+            ("-   \t code\n", "   code"),
+        ],
+    )
+    def test_first_line_indented_code(self, source: str, code: str) -> None:
+        html = Markdown()(source)
+        assert f"<pre><code>{code}\n</code></pre>" in html
+
+
+class TestClassifyIndentedContent:
+    """Tests for classify_indented_content."""
+
+    @pytest.mark.parametrize(
+        ("content", "kind"),
+        [
+            ("- item", CONTENT_LIST_MARKER),
+            ("12) item", CONTENT_LIST_MARKER),
+            ("> quote", CONTENT_BLOCK_QUOTE),
+            ("```py", CONTENT_FENCE),
+            ("~~~", CONTENT_FENCE),
+            ("``", 0),
+            ("~ x", 0),
+            ("code", 0),
+            ("", 0),
+        ],
+    )
+    def test_kinds(self, content: str, kind: int) -> None:
+        assert classify_indented_content(content) == kind
+
+
+class TestGetMarkerWidth:
+    """get_marker_width matches the first whitespace-delimited run."""
+
+    @pytest.mark.parametrize("marker", ["- ", "-", "10. ", "3)\t", "*   ", "", "1.\u00a0x"])
+    def test_matches_split(self, marker: str) -> None:
+        parts = marker.split()
+        assert get_marker_width(marker) == (len(parts[0]) if parts else 1)
+
+
+class TestDetectNestedBlockInContent:
+    """Tests for detect_nested_block_in_content."""
+
+    @pytest.mark.parametrize(
+        "line", ["- x", "1. x", "> q", "## h", "#", "***", "- - -", "_\t_ _", "*  *  *"]
+    )
+    def test_block_starts(self, line: str) -> None:
+        assert detect_nested_block_in_content(line, 2, 2)
+
+    @pytest.mark.parametrize(
+        "line", ["", "text", "-x", "#hash", "####### h", "**", "--x-", "*-*", "9 lives"]
+    )
+    def test_plain_content(self, line: str) -> None:
+        assert not detect_nested_block_in_content(line, 2, 2)
+
+    def test_four_columns_past_content_indent_is_literal(self) -> None:
+        assert not detect_nested_block_in_content("- x", 6, 2)
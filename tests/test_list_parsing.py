@@ -0,0 +1,60 @@
+"""Tests for list tightness as decided by the list parser."""
+
+import pytest
+
+from patitas import parse
+from patitas.nodes import Heading, List, Paragraph
+
+
+class TestLooseAfterNestedList:
+    """A blank line after a nested list makes the outer list loose only if the item continues."""
+
+    @pytest.mark.parametrize("blank", ["", "  ", "\t"])
+    def test_blank_before_sibling(self, blank: str) -> None:
+        doc = parse(f"- a\n  - b\n{blank}\n- c\n")
+        outer = doc.children[0]
+        assert isinstance(outer, List)
+        assert not outer.tight
+        assert outer.items[0].children[1].tight
+
+    @pytest.mark.parametrize("blank", ["", "  "])
+    def test_blank_before_content_at_content_indent(self, blank: str) -> None:
+        doc = parse(f"- a\n  - b\n{blank}\n  c\n")
+        outer = doc.children[0]
+        assert isinstance(outer, List)
+        assert not outer.tight
+        assert len(doc.children) == 1
+
+    def test_no_blank_stays_tight(self) -> None:
+        doc = parse("- a\n  - b\n- c\n")
+        outer = doc.children[0]
+        assert isinstance(outer, List)
+        assert outer.tight
+
+    @pytest.mark.parametrize("blank", ["", "  "])
+    @pytest.mark.parametrize(
+        ("source", "after"),
+        [
+            ("+ a\n  - b\n{blank}\n- foo\n", List),
+            ("1. a\n   - b\n{blank}\n2) c\n", List),
+            ("- a\n  - b\n{blank}\n# h\n", Heading),
+            ("- a\n  - b\n{blank}\nc\n", Paragraph),
+            ("- x\n  - a\n    - b\n{blank}\n- c\n", None),
+        ],
+    )
+    def test_blank_ending_the_list_keeps_it_tight(
+        self, source: str, after: type | None, blank: str
+    ) -> None:
+        doc = parse(source.format(blank=blank))
+        outer = doc.children[0]
+        assert isinstance(outer, List)
+        if after is None:
+            # Lower-indent marker: the blank ends the middle list, which
+            # stays tight, and separates items of the outermost list
+            assert not outer.tight
+            middle = outer.items[0].children[1]
+            assert isinstance(middle, List)
+            assert middle.tight
+        else:
+            assert outer.tight
+            assert isinstance(doc.children[1], after)
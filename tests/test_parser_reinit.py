@@ -99,3 +99,16 @@ class TestParserReinit:
         # Both should parse as tables
         assert ast1[0].__class__.__name__ == "Table"
         assert ast2[0].__class__.__name__ == "Table"
+
+    def test_reinit_reuses_container_stack(self):
+        """_reinit should reset the container stack in place."""
+        parser = Parser("> - a\n>\n>   b\n")
+        parser.parse()
+        containers = parser._containers
+
+        parser._reinit("- x\n- y\n")
+        assert parser._containers is containers
+        assert parser._containers.depth() == 0
+        assert parser._containers._bq_depth == 0
+        ast = parser.parse()
+        assert ast[0].tight
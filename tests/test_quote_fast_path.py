@@ -0,0 +1,65 @@
+"""Tests for the simple block quote fast path."""
+
+import pytest
+
+from patitas.lexer import Lexer
+from patitas.nodes import Paragraph
+from patitas.parsing.blocks.quote_fast_path import try_parse_simple_block_quote
+
+
+def _parse_inline(text: str, location: object) -> tuple:
+    return (text,)
+
+
+def _try(source: str):
+    tokens = list(Lexer(source).tokenize())
+    return try_parse_simple_block_quote(tokens, 0, _parse_inline), tokens
+
+
+class TestTryParseSimpleBlockQuote:
+    """Tests for try_parse_simple_block_quote."""
+
+    @pytest.mark.parametrize("source", ["> a\n", "> a\n> b\n", "> a\n\nafter\n"])
+    def test_simple(self, source: str) -> None:
+        result, _ = _try(source)
+        assert result is not None
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            ">\n",
+            "> a\nlazy\n",
+            ">> nested\n",
+            "> a\n>> nested\n",
+            "> # heading\n",
+            "> - item\n",
+            "> <div>\n",
+            ">      code\n",
+        ],
+    )
+    def test_not_simple(self, source: str) -> None:
+        result, _ = _try(source)
+        assert result is None
+
+    def test_start_must_be_a_marker(self) -> None:
+        tokens = list(Lexer("text\n").tokenize())
+        assert try_parse_simple_block_quote(tokens, 0, _parse_inline) is None
+        assert try_parse_simple_block_quote(tokens, len(tokens), _parse_inline) is None
+
+    def test_lines_join_into_one_paragraph(self) -> None:
+        result, tokens = _try(">  a\n> b\n\nafter\n")
+        assert result is not None
+        quote, pos = result
+        assert quote.children == (Paragraph(location=quote.location, children=("a\nb",)),)
+        assert tokens[pos].value.strip() == ""
+
+    def test_rejected_quote_skips_inline_parsing(self) -> None:
+        calls: list[str] = []
+
+        def parse_inline(text: str, location: object) -> tuple:
+            calls.append(text)
+            return ()
+
+        tokens = list(Lexer("> a\nlazy\n").tokenize())
+        assert try_parse_simple_block_quote(tokens, 0, parse_inline) is None
+        assert calls == []
@@ -0,0 +1,60 @@
+"""Tests for GFM table row helpers."""
+
+import pytest
+
+from patitas import Markdown
+from patitas.nodes import Table
+from patitas.parsing.blocks.table import TableParsingMixin
+
+
+class TestParseTableRow:
+    """Tests for _parse_table_row."""
+
+    @pytest.mark.parametrize(
+        ("line", "cells"),
+        [
+            ("| a | b |", [" a ", " b "]),
+            ("a|b", ["a", "b"]),
+            ("|a|", ["a"]),
+            ("a | b |  ", ["a ", " b "]),
+            ("a \\| b | c", ["a | b ", " c"]),
+            ("\\|\\||x", ["||", "x"]),
+            ("a\\\\|b", ["a\\|b"]),
+            ("\\|a\\", ["|a\\"]),
+        ],
+    )
+    def test_cells(self, line: str, cells: list[str]) -> None:
+        assert TableParsingMixin()._parse_table_row(line) == cells
+
+    def test_no_pipe_is_not_a_row(self) -> None:
+        assert TableParsingMixin()._parse_table_row("plain text") is None
+
+
+class TestParseTableDelimiter:
+    """Tests for _parse_table_delimiter."""
+
+    def test_alignments(self) -> None:
+        assert TableParsingMixin()._parse_table_delimiter("| --- |:--| --: |:-:|", 4) == (
+            None,
+            "left",
+            "right",
+            "center",
+        )
+
+    @pytest.mark.parametrize("line", ["| : |", "|::|", "| -x- |", "| - - |", "| |", "| --- |"])
+    def test_invalid(self, line: str) -> None:
+        assert TableParsingMixin()._parse_table_delimiter(line, 2) is None
+
+
+class TestTryParseTable:
+    """Tests for table construction through the parser."""
+
+    def test_cells_take_their_column_alignment(self) -> None:
+        doc = Markdown(plugins=["table"]).parse(
+            "| a | b | c |\n|:--|:-:|--:|\n| 1 | 2\n| 1 | 2 | 3 | 4 |\n"
+        )
+        table = doc.children[0]
+        assert isinstance(table, Table)
+        assert len(table.body) == 2
+        for row in (*table.head, *table.body):
+            assert [cell.align for cell in row.cells] == ["left", "center", "right"]
@@ -0,0 +1,80 @@
+"""Tests for TokenNavigationMixin helpers."""
+
+import pytest
+
+from patitas.lexer import Lexer
+from patitas.parser import Parser
+from patitas.parsing.containers import ContainerType
+from patitas.tokens import TokenType
+
+
+def _parser_at(source: str, pos: int) -> Parser:
+    parser = Parser(source)
+    parser._tokens = list(Lexer(source).tokenize())
+    parser._tokens_len = len(parser._tokens)
+    parser._pos = pos
+    parser._current = parser._tokens[pos]
+    return parser
+
+
+class TestSkipBlankLines:
+    """Tests for _skip_blank_lines."""
+
+    def test_skips_run_of_blank_lines(self) -> None:
+        parser = _parser_at("a\n\n\n\nb\n", 1)
+        assert parser._current is not None
+        assert parser._current.type == TokenType.BLANK_LINE
+        parser._skip_blank_lines()
+        assert parser._current is not None
+        assert parser._current.value.startswith("b")
+        assert parser._current is parser._tokens[parser._pos]
+
+    def test_noop_on_non_blank_token(self) -> None:
+        parser = _parser_at("a\n\nb\n", 0)
+        first = parser._current
+        parser._skip_blank_lines()
+        assert parser._pos == 0
+        assert parser._current is first
+
+    def test_stops_at_eof(self) -> None:
+        parser = _parser_at("a\n\n\n", 1)
+        parser._skip_blank_lines()
+        assert parser._at_end()
+
+
+class TestEnumIdentity:
+    """The parser compares TokenType/ContainerType members with ``is``."""
+
+    def test_token_types_are_singletons(self) -> None:
+        tokens = list(Lexer("- a\n\n> b\n").tokenize())
+        for tok in tokens:
+            assert tok.type is TokenType[tok.type.name]
+        assert not issubclass(TokenType, int)
+
+    def test_container_types_are_not_ints(self) -> None:
+        assert not issubclass(ContainerType, int)
+        assert ContainerType["LIST"] is ContainerType.LIST
+
+
+class TestLineBounds:
+    """_line_bounds agrees with a direct newline scan."""
+
+    def test_matches_find(self) -> None:
+        source = "- a\n\n  b\t\nlast"
+        parser = _parser_at(source, 0)
+        for offset in range(len(source) + 1):
+            end = source.find("\n", offset)
+            expected_end = len(source) if end == -1 else end
+            expected_start = source.rfind("\n", 0, offset) + 1
+            assert parser._line_bounds(offset) == (expected_start, expected_end)
+
+    def test_trailing_newline(self) -> None:
+        parser = _parser_at("a\n", 0)
+        assert parser._line_bounds(2) == (2, 2)
+        assert parser._get_line_at(0) == "a"
+
+    @pytest.mark.parametrize("source", ["", "x", "\n", "a\n\nb", "a\nb\n", "\n\n\n"])
+    def test_line_index(self, source: str) -> None:
+        parser = _parser_at(source, 0)
+        expected = [0] + [i + 1 for i, c in enumerate(source) if c == "\n"]
+        assert parser._line_index() == expected
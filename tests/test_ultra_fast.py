@@ -0,0 +1,22 @@
+"""Tests for the ultra-simple document fast path."""
+
+import pytest
+
+from patitas.lexer import Lexer
+from patitas.parsing.ultra_fast import can_use_ultra_fast
+
+
+def _eligible(source: str) -> bool:
+    return can_use_ultra_fast(list(Lexer(source).tokenize()))
+
+
+class TestCanUseUltraFast:
+    """Tests for can_use_ultra_fast."""
+
+    @pytest.mark.parametrize("source", ["plain text\n", "a\n\nb\n", "a =-= b\n", "== x\n"])
+    def test_eligible(self, source: str) -> None:
+        assert _eligible(source)
+
+    @pytest.mark.parametrize("source", ["a\n===\n", "a\n  -- \n", "# heading\n", "> quote\n"])
+    def test_not_eligible(self, source: str) -> None:
+        assert not _eligible(source)